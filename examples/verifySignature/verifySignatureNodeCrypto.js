@@ -0,0 +1,46 @@
+// Verifies `X-Signature` for every value of the `SIGNATURE_ALGORITHM` setting
+// using the built-in `crypto` module. Inputs:
+// - [[BODY]]: the server's response body (string);
+// - [[PUBLIC_KEY]]: base64 encoded public key from `make keys`;
+// - [[SIGNATURE]]: the `x-signature` header;
+// - [[SIGNATURE_ALGORITHM]]: the `x-signature-algorithm` header.
+// The result (boolean) is written to [[IS_SIGNATURE_VALID]].
+const crypto = require('crypto');
+
+function verifySignature(body, publicKey, signature, algorithm) {
+    const key = crypto.createPublicKey(
+        Buffer.from(publicKey, 'base64').toString('utf8')
+    );
+    const data = Buffer.from(body, 'utf8');
+    const sig = Buffer.from(signature, 'base64');
+    switch (algorithm) {
+        case 'RSA-PKCS1v15-SHA256':
+            return crypto.verify('sha256', data, {
+                key,
+                padding: crypto.constants.RSA_PKCS1_PADDING,
+            }, sig);
+        case 'RSA-PSS-SHA256':
+            return crypto.verify('sha256', data, {
+                key,
+                padding: crypto.constants.RSA_PKCS1_PSS_PADDING,
+                saltLength: 32,
+            }, sig);
+        case 'ECDSA-P256-SHA256':
+            return crypto.verify('sha256', data, {
+                key,
+                dsaEncoding: 'der',
+            }, sig);
+        case 'Ed25519':
+            return crypto.verify(null, data, key, sig);
+        default:
+            return false;
+    }
+}
+
+try {
+    [[IS_SIGNATURE_VALID]] = verifySignature(
+        [[BODY]], [[PUBLIC_KEY]], [[SIGNATURE]], [[SIGNATURE_ALGORITHM]]
+    );
+} catch (e) {
+    [[IS_SIGNATURE_VALID]] = false;
+}
@@ -0,0 +1,112 @@
+"""
+Compare the ways of creating a license task.
+
+`statements` runs the upserts and inserts as five sequential statements;
+`cte` runs `ILicenseTasksRepository.create_for_user_script`, a single
+data-modifying CTE. The difference grows with the database round trip time.
+
+Requires the database from the settings with applied migrations.
+
+Usage: PYTHONPATH=src python ./scripts/benchmark_create_task.py
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+
+from core.config import settings
+from core.models import get_sqlalchemy_engine, get_sqlalchemy_session_factory
+from core.services.uow import IUnitOfWork, UnitOfWork
+
+
+async def create_with_statements(
+    uow: IUnitOfWork, username: str, script_name: str
+) -> None:
+    async with uow:
+        user_id = await uow.users.create_one(username)
+        script_id = await uow.scripts.create_one(script_name)
+        user_script_id = await uow.users_scripts.create_one(
+            user_id=user_id, script_id=script_id
+        )
+        task_data_id = await uow.license_tasks_data.create_one()
+        await uow.license_tasks.create_one(
+            task_data_id=task_data_id, user_script_id=user_script_id
+        )
+        await uow.commit()
+
+
+async def create_with_cte(
+    uow: IUnitOfWork, username: str, script_name: str
+) -> None:
+    async with uow:
+        await uow.license_tasks.create_for_user_script(
+            username=username, script_name=script_name
+        )
+        await uow.commit()
+
+
+async def run(
+    create: Callable[[IUnitOfWork, str, str], Awaitable[None]],
+    uow_factory: Callable[[], IUnitOfWork],
+    requests: int,
+    concurrency: int,
+    users: int,
+) -> list[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    prefix = uuid.uuid4().hex[:8]
+    latencies = []
+
+    async def request(i: int) -> None:
+        async with semaphore:
+            start_time = time.perf_counter()
+            await create(
+                uow_factory(), f"bench_{prefix}_{i % users}", "bench_script"
+            )
+            latencies.append(time.perf_counter() - start_time)
+
+    await asyncio.gather(*(request(i) for i in range(requests)))
+    return latencies
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument(
+        "--users", type=int, default=100, help="number of distinct users"
+    )
+    args = parser.parse_args()
+
+    engine = get_sqlalchemy_engine(settings.dsn, debug=False)
+    session_factory = get_sqlalchemy_session_factory(engine)
+    methods = {
+        "statements": create_with_statements,
+        "cte": create_with_cte,
+    }
+    print(
+        f"{args.requests} tasks, concurrency {args.concurrency}, "
+        f"{args.users} distinct users"
+    )
+    for name, create in methods.items():
+        latencies = await run(
+            create,
+            lambda: UnitOfWork(session_factory),
+            args.requests,
+            args.concurrency,
+            args.users,
+        )
+        p95 = statistics.quantiles(latencies, n=20)[-1]
+        print(
+            f"{name:<10} "
+            f"mean {statistics.mean(latencies) * 1000:7.2f}ms "
+            f"p50 {statistics.median(latencies) * 1000:7.2f}ms "
+            f"p95 {p95 * 1000:7.2f}ms"
+        )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,147 @@
+"""
+Compare the response signing middlewares.
+
+`legacy` is the former `BaseHTTPMiddleware` implementation which buffers the
+body, re-wraps it with `iterate_in_threadpool` and hashes only the first
+chunk; `asgi` is the current `v1.middlewares.EncryptionMiddleware`.
+
+Usage: PYTHONPATH=src python ./scripts/benchmark_signature.py [--algorithm]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import time
+from collections.abc import AsyncIterator
+
+from generate_keys import (
+    ALGORITHMS,
+    encode_private_key,
+    generate_private_key,
+)
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.concurrency import iterate_in_threadpool
+from starlette.middleware import Middleware
+from starlette.middleware.base import (
+    BaseHTTPMiddleware,
+    RequestResponseEndpoint,
+)
+from starlette.requests import Request
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+
+from core.enums import SignatureAlgorithm
+from v1.middlewares import EncryptionMiddleware
+from v1.utils import ResponseSigner, get_signer
+
+CHUNK_SIZE = 16 * 1024
+
+
+class LegacyEncryptionMiddleware(BaseHTTPMiddleware):
+    async def dispatch(
+        self,
+        request: Request,
+        call_next: RequestResponseEndpoint,
+    ) -> Response:
+        response = await call_next(request)
+        if (
+            response.status_code < 500
+            and request.method in ("POST", "PUT", "PATCH")
+        ):
+            body = [section async for section in response.body_iterator]  # type: ignore
+            response.body_iterator = iterate_in_threadpool(iter(body))  # type: ignore
+
+            signer: ResponseSigner = request.app.state.signer
+            if signer.prehashed:
+                data = hashlib.sha256(body[0]).digest()
+            else:
+                data = body[0]
+            response.headers["X-Signature"] = await signer.sign(data)
+
+        return response
+
+
+def create_app(
+    middleware: type, signer: ResponseSigner, chunks: int
+) -> Starlette:
+    async def small(_: Request) -> Response:
+        return Response(b'{"error": false, "data": {}}')
+
+    async def large(_: Request) -> Response:
+        async def iterator() -> AsyncIterator[bytes]:
+            for _ in range(chunks):
+                yield b"x" * CHUNK_SIZE
+
+        return StreamingResponse(iterator())
+
+    app = Starlette(
+        routes=[
+            Route("/small", small, methods=["POST"]),
+            Route("/large", large, methods=["POST"]),
+        ],
+        middleware=[Middleware(middleware)],
+    )
+    app.state.signer = signer
+    return app
+
+
+async def run(
+    app: Starlette, path: str, requests: int, concurrency: int
+) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+
+        async def request() -> None:
+            async with semaphore:
+                response = await client.post(path)
+                assert response.headers.get("x-signature")
+
+        start_time = time.perf_counter()
+        await asyncio.gather(*(request() for _ in range(requests)))
+        return time.perf_counter() - start_time
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--chunks", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument(
+        "--algorithm", choices=ALGORITHMS, default="RSA-PKCS1v15-SHA256"
+    )
+    args = parser.parse_args()
+
+    private_key = encode_private_key(generate_private_key(args.algorithm))
+    signer = ResponseSigner(
+        get_signer(private_key, SignatureAlgorithm(args.algorithm)),
+        max_workers=args.workers,
+    )
+    middlewares = {
+        "legacy": LegacyEncryptionMiddleware,
+        "asgi": EncryptionMiddleware,
+    }
+    body_size = args.chunks * CHUNK_SIZE // 1024
+    print(
+        f"{args.algorithm}: "
+        f"{args.requests} requests, concurrency {args.concurrency}, "
+        f"large body {args.chunks} x {CHUNK_SIZE // 1024} KiB = "
+        f"{body_size} KiB"
+    )
+    for path in ("/small", "/large"):
+        for name, middleware in middlewares.items():
+            app = create_app(middleware, signer, args.chunks)
+            elapsed = await run(app, path, args.requests, args.concurrency)
+            print(
+                f"{path:<7} {name:<7} {elapsed:8.3f}s "
+                f"{args.requests / elapsed:10.1f} req/s"
+            )
+    signer.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,33 +1,71 @@
+import argparse
 import base64
 
 from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from cryptography.hazmat.primitives.asymmetric.types import (
+    PrivateKeyTypes,
+)
 
+# Values of `core.enums.SignatureAlgorithm`
+ALGORITHMS = (
+    "RSA-PKCS1v15-SHA256",
+    "RSA-PSS-SHA256",
+    "ECDSA-P256-SHA256",
+    "Ed25519",
+)
 
-def generate_rsa_keys() -> None:
-    private_key = rsa.generate_private_key(
-        public_exponent=65537,
-        key_size=2048,
-    )
+
+def generate_private_key(algorithm: str) -> PrivateKeyTypes:
+    if algorithm.startswith("RSA-"):
+        return rsa.generate_private_key(
+            public_exponent=65537,
+            key_size=2048,
+        )
+    elif algorithm == "ECDSA-P256-SHA256":
+        return ec.generate_private_key(ec.SECP256R1())
+    elif algorithm == "Ed25519":
+        return ed25519.Ed25519PrivateKey.generate()
+    raise ValueError(f"Unknown signature algorithm: {algorithm}")
+
+
+def encode_private_key(private_key: PrivateKeyTypes) -> str:
     private_pem = private_key.private_bytes(
         encoding=serialization.Encoding.PEM,
         format=serialization.PrivateFormat.PKCS8,
         encryption_algorithm=serialization.NoEncryption(),
     )
-    private_base64 = base64.b64encode(private_pem).decode("utf-8")
+    return base64.b64encode(private_pem).decode("utf-8")
+
 
+def encode_public_key(private_key: PrivateKeyTypes) -> str:
     public_key = private_key.public_key()
     public_pem = public_key.public_bytes(
         encoding=serialization.Encoding.PEM,
         format=serialization.PublicFormat.SubjectPublicKeyInfo,
     )
-    public_base64 = base64.b64encode(public_pem).decode("utf-8")
+    return base64.b64encode(public_pem).decode("utf-8")
 
-    print("Private key (base64):")
-    print(private_base64)
+
+def generate_keys(algorithm: str) -> None:
+    private_key = generate_private_key(algorithm)
+
+    print(f"Signature algorithm: {algorithm}")
+    print("\nPrivate key (base64):")
+    print(encode_private_key(private_key))
     print("\nPublic key (base64):")
-    print(public_base64)
+    print(encode_public_key(private_key))
 
 
 if __name__ == "__main__":
-    generate_rsa_keys()
+    parser = argparse.ArgumentParser(
+        description="Generate a key-pair for signing API responses"
+    )
+    parser.add_argument(
+        "algorithm",
+        nargs="?",
+        choices=ALGORITHMS,
+        default="RSA-PKCS1v15-SHA256",
+        help="value of the SIGNATURE_ALGORITHM setting",
+    )
+    generate_keys(parser.parse_args().algorithm)
@@ -4,7 +4,7 @@ from typing import Annotated
 from pydantic import Field, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from .enums import CaptchaService
+from .enums import CaptchaService, SignatureAlgorithm
 
 
 class Settings(BaseSettings):
@@ -25,10 +25,20 @@ class Settings(BaseSettings):
     loki_port: Annotated[str, Field(alias="LOKI_PORT")]
 
     private_key: Annotated[str, Field(alias="PRIVATE_KEY")]
+    signature_algorithm: Annotated[
+        SignatureAlgorithm, Field(default=SignatureAlgorithm.rsa_pkcs1v15)
+    ]
+    signature_workers: Annotated[int, Field(default=4, ge=1)]
 
     bas_username: Annotated[str, Field(alias="BAS_USERNAME")]
     bas_password: Annotated[str, Field(alias="BAS_PASSWORD")]
 
+    batch_max_size: Annotated[int, Field(default=1000, ge=1)]
+    id_cache_size: Annotated[int, Field(default=10000, ge=1)]
+    result_max_wait: Annotated[float, Field(default=30, gt=0)]
+    stream_heartbeat_interval: Annotated[float, Field(default=15, gt=0)]
+    stream_max_connections: Annotated[int, Field(default=1000, ge=1)]
+
     captcha_service: Annotated[
         CaptchaService, Field(default=CaptchaService.capmonster)
     ]
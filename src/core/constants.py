@@ -1 +1,3 @@
 NOT_FOUND = "{item} not found"
+TASK_DONE_CHANNEL = "license_task_done"
+TOO_MANY_CONNECTIONS = "Too many open connections, retry later"
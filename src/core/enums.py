@@ -9,6 +9,13 @@ class CaptchaService(Enum):
     capmonster = "capmonster.cloud"
 
 
+class SignatureAlgorithm(Enum):
+    rsa_pkcs1v15 = "RSA-PKCS1v15-SHA256"
+    rsa_pss = "RSA-PSS-SHA256"
+    ecdsa_p256 = "ECDSA-P256-SHA256"
+    ed25519 = "Ed25519"
+
+
 class Location(Enum):
     body = "body"
     path = "path"
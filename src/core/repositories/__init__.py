@@ -1,4 +1,5 @@
-from .exceptions import InvalidDataError, RepositoryError
+from .cache import IdCache, IdCacheTransaction
+from .exceptions import InvalidDataError, RepositoryError, StaleCacheError
 from .license_tasks import (
     ILicenseTasksRepository,
     SQLAlchemyLicenseTasksRepository,
@@ -16,6 +17,8 @@ from .users_scripts import (
 )
 
 __all__ = [
+    "IdCache",
+    "IdCacheTransaction",
     "InvalidDataError",
     "ILicenseTasksDataRepository",
     "ILicenseTasksRepository",
@@ -30,4 +33,5 @@ __all__ = [
     "SQLAlchemySessionsRepository",
     "SQLAlchemyUsersRepository",
     "SQLAlchemyUsersScriptsRepository",
+    "StaleCacheError",
 ]
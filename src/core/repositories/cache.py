@@ -0,0 +1,124 @@
+from collections.abc import Hashable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Self
+
+from sqlalchemy.exc import IntegrityError
+
+from core._types import UUIDv4
+from core.utils import LRUCache
+
+from .exceptions import StaleCacheError
+
+FOREIGN_KEY_VIOLATION = "23503"
+
+
+@dataclass(kw_only=True, frozen=True)
+class IdCache:
+    """
+    Ids of upserted users, scripts and their links. Rows are never updated,
+    so cached ids stay valid until the rows are deleted.
+    """
+
+    users: LRUCache[str, UUIDv4]
+    scripts: LRUCache[str, UUIDv4]
+    users_scripts: LRUCache[tuple[UUIDv4, UUIDv4], UUIDv4]
+
+    @classmethod
+    def create(cls, maxsize: int) -> Self:
+        return cls(
+            users=LRUCache("users", maxsize),
+            scripts=LRUCache("scripts", maxsize),
+            users_scripts=LRUCache("users_scripts", maxsize),
+        )
+
+    def begin(self) -> "IdCacheTransaction":
+        return IdCacheTransaction(self)
+
+    def clear(self) -> None:
+        self.users.clear()
+        self.scripts.clear()
+        self.users_scripts.clear()
+
+
+class PendingLRUCache[K: Hashable, V]:
+    """Reads from `cache`, keeps writes until `commit`"""
+
+    def __init__(self, cache: LRUCache[K, V]) -> None:
+        self._cache = cache
+        self._pending: dict[K, V] = {}
+
+    def get(self, key: K) -> V | None:
+        return self._cache.get(key)
+
+    def set(self, key: K, value: V) -> None:
+        self._pending[key] = value
+
+    def commit(self) -> None:
+        for key, value in self._pending.items():
+            self._cache.set(key, value)
+        self._pending.clear()
+
+    def rollback(self) -> None:
+        self._pending.clear()
+
+
+class IdCacheTransaction:
+    """
+    `IdCache` seen from a unit of work. Ids of new rows are written to the
+    shared cache only on commit, so rolled back rows are never cached.
+    """
+
+    def __init__(self, id_cache: IdCache) -> None:
+        self._id_cache = id_cache
+        self.users = PendingLRUCache(id_cache.users)
+        self.scripts = PendingLRUCache(id_cache.scripts)
+        self.users_scripts = PendingLRUCache(id_cache.users_scripts)
+
+    def get_user_script(
+        self, username: str, script_name: str
+    ) -> UUIDv4 | None:
+        user_id = self.users.get(username)
+        script_id = self.scripts.get(script_name)
+        if user_id is None or script_id is None:
+            return None
+        return self.users_scripts.get((user_id, script_id))
+
+    def set_user_script(
+        self,
+        username: str,
+        script_name: str,
+        *,
+        user_id: UUIDv4,
+        script_id: UUIDv4,
+        user_script_id: UUIDv4,
+    ) -> None:
+        self.users.set(username, user_id)
+        self.scripts.set(script_name, script_id)
+        self.users_scripts.set((user_id, script_id), user_script_id)
+
+    def commit(self) -> None:
+        self.users.commit()
+        self.scripts.commit()
+        self.users_scripts.commit()
+
+    def rollback(self) -> None:
+        self.users.rollback()
+        self.scripts.rollback()
+        self.users_scripts.rollback()
+
+    @contextmanager
+    def invalidate_on_stale(self) -> Iterator[None]:
+        """
+        Clear the cache and raise `StaleCacheError` if a statement using
+        cached ids violates a foreign key, i.e. a cached row was deleted.
+        The transaction must be retried.
+        """
+        try:
+            yield
+        except IntegrityError as e:
+            if getattr(e.orig, "pgcode", None) != FOREIGN_KEY_VIOLATION:
+                raise
+            self.rollback()
+            self._id_cache.clear()
+            raise StaleCacheError from e
@@ -9,3 +9,8 @@ class InvalidDataError(RepositoryError):
         super().__init__(
             f"Invalid data, expected dict or Pydantic model, got {type(data)}"
         )
+
+
+class StaleCacheError(RepositoryError):
+    def __init__(self) -> None:
+        super().__init__("Cached id refers to a deleted row")
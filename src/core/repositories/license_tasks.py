@@ -1,12 +1,25 @@
+import uuid
+from collections.abc import Iterable, Sequence
+from contextlib import AbstractContextManager, nullcontext
 from typing import Protocol
 
-from sqlalchemy import select
+from sqlalchemy import any_, bindparam, insert, select, true
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from core._types import UUIDv4
-from core.models import LicenseTasksModel
+from core.models import (
+    LicenseTasksDataModel,
+    LicenseTasksModel,
+    ScriptsModel,
+    UsersModel,
+    UsersScriptsModel,
+)
 
 from .base import ISQLAlchemyRepository, SQLAlchemyRepository
+from .cache import IdCacheTransaction
 
 
 class ILicenseTasksRepository(
@@ -16,23 +29,153 @@ class ILicenseTasksRepository(
         self, *, task_data_id: UUIDv4, user_script_id: UUIDv4
     ) -> LicenseTasksModel: ...
 
+    async def create_many(
+        self, items: Iterable[tuple[UUIDv4, UUIDv4]], /
+    ) -> list[UUIDv4]: ...
+
+    async def create_for_user_script(
+        self, *, username: str, script_name: str
+    ) -> tuple[UUIDv4, UUIDv4]: ...
+
     async def read_one(
         self, task_id: UUIDv4, /
     ) -> LicenseTasksModel | None: ...
 
+    async def read_many(
+        self, task_ids: Iterable[UUIDv4], /
+    ) -> Sequence[LicenseTasksModel]: ...
+
 
 class SQLAlchemyLicenseTasksRepository(
     SQLAlchemyRepository[LicenseTasksModel]
 ):
+    def __init__(
+        self, session: AsyncSession, id_cache: IdCacheTransaction | None = None
+    ) -> None:
+        super().__init__(session)
+        self._id_cache = id_cache
+
     async def create_one(
         self, *, task_data_id: UUIDv4, user_script_id: UUIDv4
     ) -> LicenseTasksModel:
-        res = await self.create(
-            dict(task_data_id=task_data_id, user_script_id=user_script_id),
-            returning=[self.model.id],
-        )
+        with self._invalidate_on_stale():
+            res = await self.create(
+                dict(
+                    task_data_id=task_data_id, user_script_id=user_script_id
+                ),
+                returning=[self.model.id],
+            )
         return res.scalar_one()
 
+    async def create_many(
+        self, items: Iterable[tuple[UUIDv4, UUIDv4]], /
+    ) -> list[UUIDv4]:
+        """Insert tasks from `(task_data_id, user_script_id)` pairs"""
+        values = [
+            dict(
+                id=uuid.uuid4(),
+                task_data_id=task_data_id,
+                user_script_id=user_script_id,
+            )
+            for task_data_id, user_script_id in items
+        ]
+        if values:
+            with self._invalidate_on_stale():
+                await self.session.execute(
+                    insert(self.model).values(values)
+                )
+        return [value["id"] for value in values]
+
+    async def create_for_user_script(
+        self, *, username: str, script_name: str
+    ) -> tuple[UUIDv4, UUIDv4]:
+        """
+        Upsert user, script and their link and create a task with its data
+        in a single statement. Return `(task_id, task_data_id)`. The upserts
+        are skipped if the user script id is cached.
+        """
+        if self._id_cache is not None:
+            user_script_id = self._id_cache.get_user_script(
+                username, script_name
+            )
+            if user_script_id is not None:
+                with self._id_cache.invalidate_on_stale():
+                    return await self._create_for_user_script_id(
+                        user_script_id
+                    )
+        users_stmt = pg_insert(UsersModel).values(username=username)
+        users = users_stmt.on_conflict_do_update(
+            index_elements=[UsersModel.username],
+            set_=dict(username=users_stmt.excluded.username),
+        ).returning(UsersModel.id).cte("upsert_user")
+        scripts_stmt = pg_insert(ScriptsModel).values(script_name=script_name)
+        scripts = scripts_stmt.on_conflict_do_update(
+            index_elements=[ScriptsModel.script_name],
+            set_=dict(script_name=scripts_stmt.excluded.script_name),
+        ).returning(ScriptsModel.id).cte("upsert_script")
+        users_scripts_stmt = pg_insert(UsersScriptsModel).from_select(
+            ["user_id", "script_id"],
+            select(users.c.id, scripts.c.id).select_from(
+                users.join(scripts, true())
+            ),
+        )
+        users_scripts = (
+            users_scripts_stmt.on_conflict_do_update(
+                index_elements=[
+                    UsersScriptsModel.user_id,
+                    UsersScriptsModel.script_id,
+                ],
+                set_=dict(user_id=users_scripts_stmt.excluded.user_id),
+            )
+            .returning(
+                UsersScriptsModel.id,
+                UsersScriptsModel.user_id,
+                UsersScriptsModel.script_id,
+            )
+            .cte("upsert_user_script")
+        )
+        task_data = (
+            insert(LicenseTasksDataModel)
+            .values(id=uuid.uuid4())
+            .returning(LicenseTasksDataModel.id)
+            .cte("insert_task_data")
+        )
+        tasks = (
+            insert(self.model)
+            .from_select(
+                ["task_data_id", "user_script_id"],
+                select(task_data.c.id, users_scripts.c.id).select_from(
+                    task_data.join(users_scripts, true())
+                ),
+            )
+            .returning(
+                self.model.id,
+                self.model.task_data_id,
+                self.model.user_script_id,
+            )
+            .cte("insert_task")
+        )
+        stmt = select(
+            tasks.c.id,
+            tasks.c.task_data_id,
+            users_scripts.c.user_id,
+            users_scripts.c.script_id,
+            users_scripts.c.id,
+        ).join_from(
+            tasks, users_scripts, tasks.c.user_script_id == users_scripts.c.id
+        )
+        res = await self.session.execute(stmt)
+        task_id, task_data_id, user_id, script_id, user_script_id = res.one()
+        if self._id_cache is not None:
+            self._id_cache.set_user_script(
+                username,
+                script_name,
+                user_id=user_id,
+                script_id=script_id,
+                user_script_id=user_script_id,
+            )
+        return task_id, task_data_id
+
     async def read_one(self, task_id: UUIDv4, /) -> LicenseTasksModel | None:
         stmt = (
             select(self.model)
@@ -41,3 +184,45 @@ class SQLAlchemyLicenseTasksRepository(
         )
         res = await self.session.execute(stmt)
         return res.scalar_one_or_none()
+
+    async def read_many(
+        self, task_ids: Iterable[UUIDv4], /
+    ) -> Sequence[LicenseTasksModel]:
+        ids = bindparam("task_ids", list(task_ids), type_=ARRAY(UUID))
+        stmt = (
+            select(self.model)
+            .filter(self.model.id == any_(ids))
+            .options(joinedload(self.model.task_data))
+        )
+        res = await self.session.execute(stmt)
+        return res.scalars().all()
+
+    async def _create_for_user_script_id(
+        self, user_script_id: UUIDv4
+    ) -> tuple[UUIDv4, UUIDv4]:
+        task_data = (
+            insert(LicenseTasksDataModel)
+            .values(id=uuid.uuid4())
+            .returning(LicenseTasksDataModel.id)
+            .cte("insert_task_data")
+        )
+        stmt = (
+            insert(self.model)
+            .from_select(
+                ["task_data_id", "user_script_id"],
+                select(
+                    task_data.c.id,
+                    bindparam("user_script_id", user_script_id, type_=UUID),
+                ),
+            )
+            .returning(self.model.id, self.model.task_data_id)
+        )
+        res = await self.session.execute(stmt)
+        task_id, task_data_id = res.one()
+        return task_id, task_data_id
+
+    def _invalidate_on_stale(self) -> AbstractContextManager[None]:
+        # user script ids may come from the cache
+        if self._id_cache is None:
+            return nullcontext()
+        return self._id_cache.invalidate_on_stale()
@@ -1,7 +1,11 @@
+import uuid
 from datetime import datetime
 from typing import Protocol
 
+from sqlalchemy import func, insert, select
+
 from core._types import UUIDv4
+from core.constants import TASK_DONE_CHANNEL
 from core.enums import LicenseResultStatus
 from core.models import LicenseTasksDataModel
 
@@ -13,6 +17,8 @@ class ILicenseTasksDataRepository(
 ):
     async def create_one(self) -> UUIDv4: ...
 
+    async def create_many(self, count: int, /) -> list[UUIDv4]: ...
+
     async def add_task_data(
         self,
         task_data_id: UUIDv4,
@@ -22,6 +28,8 @@ class ILicenseTasksDataRepository(
         is_expired: bool | None = None,
     ) -> UUIDv4 | None: ...
 
+    async def notify_done(self, task_data_id: UUIDv4, /) -> None: ...
+
 
 class SQLAlchemyLicenseTasksDataRepository(
     SQLAlchemyRepository[LicenseTasksDataModel]
@@ -30,6 +38,14 @@ class SQLAlchemyLicenseTasksDataRepository(
         res = await self.create(dict(), returning=[self.model.id])
         return res.scalar_one()
 
+    async def create_many(self, count: int, /) -> list[UUIDv4]:
+        ids = [uuid.uuid4() for _ in range(count)]
+        if ids:
+            await self.session.execute(
+                insert(self.model).values([dict(id=id_) for id_ in ids])
+            )
+        return ids
+
     async def add_task_data(
         self,
         task_data_id: UUIDv4,
@@ -45,3 +61,9 @@ class SQLAlchemyLicenseTasksDataRepository(
             returning=[self.model.id],
         )
         return res.scalar_one_or_none()
+
+    async def notify_done(self, task_data_id: UUIDv4, /) -> None:
+        """Notify listeners of `TASK_DONE_CHANNEL` on transaction commit"""
+        await self.session.execute(
+            select(func.pg_notify(TASK_DONE_CHANNEL, str(task_data_id)))
+        )
@@ -1,23 +1,69 @@
+from collections.abc import Iterable
 from typing import Protocol
 
 from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from core._types import UUIDv4
 from core.models import ScriptsModel
 
 from .base import ISQLAlchemyRepository, SQLAlchemyRepository
+from .cache import IdCacheTransaction
 
 
 class IScriptsRepository(ISQLAlchemyRepository[ScriptsModel], Protocol):
     async def create_one(self, script_name: str, /) -> UUIDv4: ...
 
+    async def create_many(
+        self, script_names: Iterable[str], /
+    ) -> dict[str, UUIDv4]: ...
+
 
 class SQLAlchemyScriptsRepository(SQLAlchemyRepository[ScriptsModel]):
+    def __init__(
+        self, session: AsyncSession, id_cache: IdCacheTransaction | None = None
+    ) -> None:
+        super().__init__(session)
+        self._id_cache = id_cache
+
     async def create_one(self, script_name: str, /) -> UUIDv4:
+        if self._id_cache is not None:
+            script_id = self._id_cache.scripts.get(script_name)
+            if script_id is not None:
+                return script_id
         insert_stmt = insert(self.model).values(script_name=script_name)
         stmt = insert_stmt.on_conflict_do_update(
             index_elements=[self.model.script_name],
             set_=dict(script_name=insert_stmt.excluded.script_name),
         ).returning(self.model.id)
         res = await self.session.execute(stmt)
-        return res.scalar_one()
+        script_id = res.scalar_one()
+        if self._id_cache is not None:
+            self._id_cache.scripts.set(script_name, script_id)
+        return script_id
+
+    async def create_many(
+        self, script_names: Iterable[str], /
+    ) -> dict[str, UUIDv4]:
+        ids: dict[str, UUIDv4] = {}
+        missing = set(script_names)
+        if self._id_cache is not None:
+            for script_name in missing:
+                script_id = self._id_cache.scripts.get(script_name)
+                if script_id is not None:
+                    ids[script_name] = script_id
+            missing.difference_update(ids)
+        if not missing:
+            return ids
+        values = [dict(script_name=name) for name in missing]
+        insert_stmt = insert(self.model).values(values)
+        stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[self.model.script_name],
+            set_=dict(script_name=insert_stmt.excluded.script_name),
+        ).returning(self.model.script_name, self.model.id)
+        res = await self.session.execute(stmt)
+        for script_name, script_id in res.tuples():
+            ids[script_name] = script_id
+            if self._id_cache is not None:
+                self._id_cache.scripts.set(script_name, script_id)
+        return ids
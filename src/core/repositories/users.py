@@ -1,23 +1,69 @@
+from collections.abc import Iterable
 from typing import Protocol
 
 from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from core._types import UUIDv4
 from core.models import UsersModel
 
 from .base import ISQLAlchemyRepository, SQLAlchemyRepository
+from .cache import IdCacheTransaction
 
 
 class IUsersRepository(ISQLAlchemyRepository[UsersModel], Protocol):
     async def create_one(self, username: str, /) -> UUIDv4: ...
 
+    async def create_many(
+        self, usernames: Iterable[str], /
+    ) -> dict[str, UUIDv4]: ...
+
 
 class SQLAlchemyUsersRepository(SQLAlchemyRepository[UsersModel]):
+    def __init__(
+        self, session: AsyncSession, id_cache: IdCacheTransaction | None = None
+    ) -> None:
+        super().__init__(session)
+        self._id_cache = id_cache
+
     async def create_one(self, username: str, /) -> UUIDv4:
+        if self._id_cache is not None:
+            user_id = self._id_cache.users.get(username)
+            if user_id is not None:
+                return user_id
         insert_stmt = insert(self.model).values(username=username)
         stmt = insert_stmt.on_conflict_do_update(
             index_elements=[self.model.username],
             set_=dict(username=insert_stmt.excluded.username),
         ).returning(self.model.id)
         res = await self.session.execute(stmt)
-        return res.scalar_one()
+        user_id = res.scalar_one()
+        if self._id_cache is not None:
+            self._id_cache.users.set(username, user_id)
+        return user_id
+
+    async def create_many(
+        self, usernames: Iterable[str], /
+    ) -> dict[str, UUIDv4]:
+        ids: dict[str, UUIDv4] = {}
+        missing = set(usernames)
+        if self._id_cache is not None:
+            for username in missing:
+                user_id = self._id_cache.users.get(username)
+                if user_id is not None:
+                    ids[username] = user_id
+            missing.difference_update(ids)
+        if not missing:
+            return ids
+        values = [dict(username=username) for username in missing]
+        insert_stmt = insert(self.model).values(values)
+        stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[self.model.username],
+            set_=dict(username=insert_stmt.excluded.username),
+        ).returning(self.model.username, self.model.id)
+        res = await self.session.execute(stmt)
+        for username, user_id in res.tuples():
+            ids[username] = user_id
+            if self._id_cache is not None:
+                self._id_cache.users.set(username, user_id)
+        return ids
@@ -1,11 +1,15 @@
+from collections.abc import Iterable
+from contextlib import AbstractContextManager, nullcontext
 from typing import Protocol
 
 from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from core._types import UUIDv4
 from core.models import UsersScriptsModel
 
 from .base import ISQLAlchemyRepository, SQLAlchemyRepository
+from .cache import IdCacheTransaction
 
 
 class IUsersScriptsRepository(
@@ -15,13 +19,29 @@ class IUsersScriptsRepository(
         self, *, user_id: UUIDv4, script_id: UUIDv4
     ) -> UUIDv4: ...
 
+    async def create_many(
+        self, pairs: Iterable[tuple[UUIDv4, UUIDv4]], /
+    ) -> dict[tuple[UUIDv4, UUIDv4], UUIDv4]: ...
+
 
 class SQLAlchemyUsersScriptsRepository(
     SQLAlchemyRepository[UsersScriptsModel]
 ):
+    def __init__(
+        self, session: AsyncSession, id_cache: IdCacheTransaction | None = None
+    ) -> None:
+        super().__init__(session)
+        self._id_cache = id_cache
+
     async def create_one(
         self, *, user_id: UUIDv4, script_id: UUIDv4
     ) -> UUIDv4:
+        if self._id_cache is not None:
+            user_script_id = self._id_cache.users_scripts.get(
+                (user_id, script_id)
+            )
+            if user_script_id is not None:
+                return user_script_id
         insert_stmt = insert(self.model).values(
             user_id=user_id, script_id=script_id
         )
@@ -32,5 +52,53 @@ class SQLAlchemyUsersScriptsRepository(
                 script_id=insert_stmt.excluded.script_id,
             ),
         ).returning(self.model.id)
-        res = await self.session.execute(stmt)
-        return res.scalar_one()
+        with self._invalidate_on_stale():
+            res = await self.session.execute(stmt)
+        user_script_id = res.scalar_one()
+        if self._id_cache is not None:
+            self._id_cache.users_scripts.set(
+                (user_id, script_id), user_script_id
+            )
+        return user_script_id
+
+    async def create_many(
+        self, pairs: Iterable[tuple[UUIDv4, UUIDv4]], /
+    ) -> dict[tuple[UUIDv4, UUIDv4], UUIDv4]:
+        """Upsert `(user_id, script_id)` pairs"""
+        ids: dict[tuple[UUIDv4, UUIDv4], UUIDv4] = {}
+        missing = set(pairs)
+        if self._id_cache is not None:
+            for pair in missing:
+                user_script_id = self._id_cache.users_scripts.get(pair)
+                if user_script_id is not None:
+                    ids[pair] = user_script_id
+            missing.difference_update(ids)
+        if not missing:
+            return ids
+        values = [
+            dict(user_id=user_id, script_id=script_id)
+            for user_id, script_id in missing
+        ]
+        insert_stmt = insert(self.model).values(values)
+        stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[self.model.user_id, self.model.script_id],
+            set_=dict(
+                user_id=insert_stmt.excluded.user_id,
+                script_id=insert_stmt.excluded.script_id,
+            ),
+        ).returning(self.model.user_id, self.model.script_id, self.model.id)
+        with self._invalidate_on_stale():
+            res = await self.session.execute(stmt)
+        for user_id, script_id, user_script_id in res.tuples():
+            ids[user_id, script_id] = user_script_id
+            if self._id_cache is not None:
+                self._id_cache.users_scripts.set(
+                    (user_id, script_id), user_script_id
+                )
+        return ids
+
+    def _invalidate_on_stale(self) -> AbstractContextManager[None]:
+        # user and script ids may come from the cache
+        if self._id_cache is None:
+            return nullcontext()
+        return self._id_cache.invalidate_on_stale()
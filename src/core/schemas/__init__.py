@@ -4,22 +4,38 @@ from .errors import TaskNotFoundSchema
 from .schemas import (
     CreateLicenseTaskInSchema,
     CreateLicenseTaskOutSchema,
+    CreateLicenseTasksBatchInSchema,
+    CreateLicenseTasksBatchOutSchema,
     LicenseDetailsSchema,
     TaskLicenseResultInSchema,
+    TaskLicenseResultItemSchema,
     TaskLicenseResultOutSchema,
+    TaskLicenseResultsBatchInSchema,
+    TaskLicenseResultsBatchOutSchema,
+)
+from .wrappers import (
+    LicenceTaskResultEvent,
+    LicenceTasksBatchUseCaseOut,
+    LicenceTaskUseCaseOut,
 )
-from .wrappers import LicenceTaskUseCaseOut
 
 __all__ = [
     "ErrorDetailsSchema",
     "ErrorResponse",
     "CreateLicenseTaskInSchema",
     "CreateLicenseTaskOutSchema",
+    "CreateLicenseTasksBatchInSchema",
+    "CreateLicenseTasksBatchOutSchema",
     "LicenseDetailsSchema",
     "LicenseResultStatus",
+    "LicenceTaskResultEvent",
+    "LicenceTasksBatchUseCaseOut",
     "LicenceTaskUseCaseOut",
     "TaskLicenseResultInSchema",
+    "TaskLicenseResultItemSchema",
     "TaskLicenseResultOutSchema",
+    "TaskLicenseResultsBatchInSchema",
+    "TaskLicenseResultsBatchOutSchema",
     "TaskNotFoundSchema",
     "SuccessResponse",
 ]
@@ -1,8 +1,10 @@
 from datetime import datetime
+from typing import Annotated
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from core._types import UUIDv4
+from core.config import settings
 from core.enums import LicenseResultStatus
 
 
@@ -11,20 +13,54 @@ class CreateLicenseTaskInSchema(BaseModel):
     script_name: str
 
 
+class LicenseDetailsSchema(BaseModel):
+    is_expired: bool
+    expires_in: datetime
+
+
+class TaskLicenseResultOutSchema(BaseModel):
+    status: LicenseResultStatus
+    credentials: LicenseDetailsSchema | None = None
+
+
 class CreateLicenseTaskOutSchema(BaseModel):
     task_id: UUIDv4
     credentials: CreateLicenseTaskInSchema
+    result: Annotated[
+        TaskLicenseResultOutSchema | None,
+        Field(
+            default=None,
+            description="Task result if it was ready within `wait_ms`",
+        ),
+    ]
 
 
-class LicenseDetailsSchema(BaseModel):
-    is_expired: bool
-    expires_in: datetime
+class CreateLicenseTasksBatchInSchema(BaseModel):
+    tasks: Annotated[
+        list[CreateLicenseTaskInSchema],
+        Field(min_length=1, max_length=settings.batch_max_size),
+    ]
+
+
+class CreateLicenseTasksBatchOutSchema(BaseModel):
+    tasks: list[CreateLicenseTaskOutSchema]
 
 
 class TaskLicenseResultInSchema(BaseModel):
     task_id: UUIDv4
 
 
-class TaskLicenseResultOutSchema(BaseModel):
-    status: LicenseResultStatus
-    credentials: LicenseDetailsSchema | None = None
+class TaskLicenseResultsBatchInSchema(BaseModel):
+    task_ids: Annotated[
+        list[UUIDv4],
+        Field(min_length=1, max_length=settings.batch_max_size),
+    ]
+
+
+class TaskLicenseResultItemSchema(TaskLicenseResultOutSchema):
+    task_id: UUIDv4
+
+
+class TaskLicenseResultsBatchOutSchema(BaseModel):
+    results: list[TaskLicenseResultItemSchema]
+    not_found: list[UUIDv4]
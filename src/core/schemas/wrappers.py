@@ -1,10 +1,26 @@
+from datetime import datetime
+
 from pydantic import BaseModel
 
 from core._types import UUIDv4
 
-from .schemas import CreateLicenseTaskOutSchema
+from .schemas import (
+    CreateLicenseTaskOutSchema,
+    CreateLicenseTasksBatchOutSchema,
+    TaskLicenseResultItemSchema,
+)
 
 
 class LicenceTaskUseCaseOut(BaseModel):
     response_data: CreateLicenseTaskOutSchema
     task_data_id: UUIDv4
+
+
+class LicenceTasksBatchUseCaseOut(BaseModel):
+    response_data: CreateLicenseTasksBatchOutSchema
+    task_data_ids: list[UUIDv4]
+
+
+class LicenceTaskResultEvent(BaseModel):
+    response_data: TaskLicenseResultItemSchema
+    cursor: datetime
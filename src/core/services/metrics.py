@@ -18,3 +18,31 @@ OUTGOING_REQUESTS_IN_PROGRESS = Gauge(
     "Number of outgoing HTTP requests in progress",
     ["method", "endpoint"]
 )
+
+RESPONSE_SIGNATURE_LATENCY = Histogram(
+    "response_signature_latency_seconds",
+    "Time spent computing a response signature in the signer executor",
+    ["algorithm"]
+)
+
+RESPONSE_SIGNATURE_WAIT = Histogram(
+    "response_signature_wait_seconds",
+    "Time a response waits for its signature, including executor queueing",
+)
+
+RESPONSE_SIGNATURES_IN_PROGRESS = Gauge(
+    "response_signatures_inprogress",
+    "Number of response signatures queued or being computed",
+)
+
+CACHE_HITS = Counter(
+    "cache_hits_total",
+    "Total number of in-process cache hits",
+    ["cache"]
+)
+
+CACHE_MISSES = Counter(
+    "cache_misses_total",
+    "Total number of in-process cache misses",
+    ["cache"]
+)
@@ -0,0 +1,146 @@
+import asyncio
+import uuid
+from collections import defaultdict
+from collections.abc import AsyncIterator, Iterable
+from contextlib import (
+    AbstractAsyncContextManager,
+    asynccontextmanager,
+    suppress,
+)
+from logging import Logger
+from typing import Any, Protocol
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from core._types import UUIDv4
+from core.constants import TASK_DONE_CHANNEL
+
+
+class ITaskNotifier(Protocol):
+    def subscribe(
+        self, task_data_id: UUIDv4, /
+    ) -> AbstractAsyncContextManager[asyncio.Future[None]]: ...
+
+    def subscribe_many(
+        self, task_data_ids: Iterable[UUIDv4], /
+    ) -> AbstractAsyncContextManager[asyncio.Queue[UUIDv4]]: ...
+
+
+class TaskNotifier:
+    """
+    Wake up coroutines waiting for task results. Workers send
+    `pg_notify(TASK_DONE_CHANNEL, task_data_id)` when a result is saved; a
+    single connection per process listens to the channel.
+    """
+
+    RECONNECT_DELAY = 1
+
+    def __init__(self, engine: AsyncEngine, logger: Logger) -> None:
+        self._engine = engine
+        self._logger = logger
+        self._waiters: defaultdict[UUIDv4, set[asyncio.Future[None]]] = (
+            defaultdict(set)
+        )
+        self._queues: defaultdict[UUIDv4, set[asyncio.Queue[UUIDv4]]] = (
+            defaultdict(set)
+        )
+        self._connection: AsyncConnection | None = None
+        self._reconnect_task: asyncio.Task[None] | None = None
+        self._closed = False
+
+    async def start(self) -> None:
+        self._closed = False
+        self._connection = await self._engine.connect()
+        raw_connection = await self._connection.get_raw_connection()
+        driver_connection: Any = raw_connection.driver_connection
+        await driver_connection.add_listener(
+            TASK_DONE_CHANNEL, self._on_notification
+        )
+        driver_connection.add_termination_listener(self._on_termination)
+
+    async def stop(self) -> None:
+        self._closed = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+        if self._connection is not None:
+            await self._connection.invalidate()
+            await self._connection.close()
+            self._connection = None
+        for waiters in self._waiters.values():
+            for waiter in waiters:
+                waiter.cancel()
+        self._waiters.clear()
+
+    @asynccontextmanager
+    async def subscribe(
+        self, task_data_id: UUIDv4, /
+    ) -> AsyncIterator[asyncio.Future[None]]:
+        """
+        Yield a future resolved when the result of `task_data_id` is saved.
+        Re-read the task after subscribing to not miss a notification sent
+        in between.
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[task_data_id].add(waiter)
+        try:
+            yield waiter
+        finally:
+            waiters = self._waiters.get(task_data_id)
+            if waiters is not None:
+                waiters.discard(waiter)
+                if not waiters:
+                    del self._waiters[task_data_id]
+
+    @asynccontextmanager
+    async def subscribe_many(
+        self, task_data_ids: Iterable[UUIDv4], /
+    ) -> AsyncIterator[asyncio.Queue[UUIDv4]]:
+        """Yield a queue receiving ids of saved results of `task_data_ids`"""
+        queue: asyncio.Queue[UUIDv4] = asyncio.Queue()
+        task_data_ids = set(task_data_ids)
+        for task_data_id in task_data_ids:
+            self._queues[task_data_id].add(queue)
+        try:
+            yield queue
+        finally:
+            for task_data_id in task_data_ids:
+                queues = self._queues.get(task_data_id)
+                if queues is not None:
+                    queues.discard(queue)
+                    if not queues:
+                        del self._queues[task_data_id]
+
+    def _on_notification(
+        self, _: Any, __: int, ___: str, payload: str
+    ) -> None:
+        try:
+            task_data_id = uuid.UUID(payload)
+        except ValueError:
+            return
+        for waiter in self._waiters.pop(task_data_id, ()):
+            if not waiter.done():
+                waiter.set_result(None)
+        for queue in self._queues.get(task_data_id, ()):
+            queue.put_nowait(task_data_id)
+
+    def _on_termination(self, _: Any) -> None:
+        if self._closed:
+            return
+        self._logger.error("Task notifier connection lost, reconnecting")
+        self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        if self._connection is not None:
+            with suppress(Exception):
+                await self._connection.invalidate()
+                await self._connection.close()
+            self._connection = None
+        while not self._closed:
+            try:
+                await self.start()
+                return
+            except Exception as e:
+                self._logger.error(
+                    "Task notifier reconnect failed", exc_info=e
+                )
+                await asyncio.sleep(self.RECONNECT_DELAY)
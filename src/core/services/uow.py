@@ -4,6 +4,8 @@ from typing import Protocol, Self
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from core.repositories import (
+    IdCache,
+    IdCacheTransaction,
     ILicenseTasksDataRepository,
     ILicenseTasksRepository,
     IScriptsRepository,
@@ -54,13 +56,16 @@ class IUnitOfWork(Protocol):
 
 class UnitOfWork:
     def __init__(
-        self, session_factory: async_sessionmaker[AsyncSession]
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        id_cache: IdCache | None = None,
     ) -> None:
         self._session_factory = session_factory
+        self._id_cache = id_cache
 
     @property
     def license_tasks(self) -> ILicenseTasksRepository:
-        return SQLAlchemyLicenseTasksRepository(self._session)
+        return SQLAlchemyLicenseTasksRepository(self._session, self._ids)
 
     @property
     def license_tasks_data(self) -> ILicenseTasksDataRepository:
@@ -68,7 +73,7 @@ class UnitOfWork:
 
     @property
     def scripts(self) -> IScriptsRepository:
-        return SQLAlchemyScriptsRepository(self._session)
+        return SQLAlchemyScriptsRepository(self._session, self._ids)
 
     @property
     def sessions(self) -> ISessionsRepository:
@@ -76,23 +81,32 @@ class UnitOfWork:
 
     @property
     def users(self) -> IUsersRepository:
-        return SQLAlchemyUsersRepository(self._session)
+        return SQLAlchemyUsersRepository(self._session, self._ids)
 
     @property
     def users_scripts(self) -> IUsersScriptsRepository:
-        return SQLAlchemyUsersScriptsRepository(self._session)
+        return SQLAlchemyUsersScriptsRepository(
+            self._session, self._ids
+        )
 
     async def commit(self) -> None:
         await self._session.commit()
+        if self._ids is not None:
+            self._ids.commit()
 
     async def rollback(self) -> None:
         await self._session.rollback()
+        if self._ids is not None:
+            self._ids.rollback()
 
     async def _close(self) -> None:
         await self._session.close()
 
     async def __aenter__(self) -> Self:
         self._session = self._session_factory()
+        self._ids: IdCacheTransaction | None = (
+            self._id_cache.begin() if self._id_cache is not None else None
+        )
         return self
 
     async def __aexit__(
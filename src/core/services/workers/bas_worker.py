@@ -1,4 +1,5 @@
 import asyncio
+from collections.abc import Sequence
 from logging import Logger
 from typing import Protocol
 
@@ -30,9 +31,14 @@ class IBasWorker(Protocol):
         self, task_data_id: UUIDv4, user: str, script: str
     ) -> None: ...
 
+    async def process_many(
+        self, tasks: Sequence[tuple[UUIDv4, str, str]]
+    ) -> None: ...
+
 
 class BasWorker:
     ENV_SESSION = "BAS_SESSION"
+    BATCH_CONCURRENCY = 10
 
     def __init__(
         self,
@@ -53,17 +59,39 @@ class BasWorker:
         self._license_use_case = license_use_case
         self._bas_session_use_case = bas_session_use_case
         self._api_client = BasAPIClient(http_client, logger)
+        self._logger = logger
         self._bas_session: str | None = None
         self._session_lock = asyncio.Lock()
 
     async def __call__(
         self, task_data_id: UUIDv4, user: str, script: str
     ) -> None:
+        await self._load_session()
+        license_data = await self._get_license_data(user, script)
+        await self._save_license_data(task_data_id, license_data)
+
+    async def process_many(
+        self, tasks: Sequence[tuple[UUIDv4, str, str]]
+    ) -> None:
+        """Process `(task_data_id, user, script)` tasks as a single job"""
+        await self._load_session()
+        semaphore = asyncio.Semaphore(self.BATCH_CONCURRENCY)
+
+        async def process(task_data_id: UUIDv4, user: str, script: str):
+            async with semaphore:
+                await self(task_data_id, user, script)
+
+        results = await asyncio.gather(
+            *(process(*task) for task in tasks), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                self._logger.error("BAS worker task failed", exc_info=result)
+
+    async def _load_session(self) -> None:
         if self._bas_session is None:
             self._bas_session = await self._bas_session_use_case.get_session()
             await self._ensure_session_update()
-        license_data = await self._get_license_data(user, script)
-        await self._save_license_data(task_data_id, license_data)
 
     def _set_bas_session(self) -> None:
         if self._bas_session:
@@ -38,4 +38,5 @@ class LicenseUseCase:
                 expires_in=expires_in,
                 is_expired=is_expired,
             )
+            await self._uow.license_tasks_data.notify_done(task_data_id)
             await self._uow.commit()
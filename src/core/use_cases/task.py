@@ -1,46 +1,205 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterable, Sequence
+from datetime import datetime
 from typing import Protocol
 
+from core._types import UUIDv4
+from core.enums import LicenseResultStatus
+from core.models import LicenseTasksDataModel, LicenseTasksModel
+from core.repositories import StaleCacheError
 from core.schemas import (
     CreateLicenseTaskInSchema,
     CreateLicenseTaskOutSchema,
+    CreateLicenseTasksBatchOutSchema,
+    LicenceTaskResultEvent,
+    LicenceTasksBatchUseCaseOut,
     LicenceTaskUseCaseOut,
     LicenseDetailsSchema,
     TaskLicenseResultInSchema,
+    TaskLicenseResultItemSchema,
     TaskLicenseResultOutSchema,
+    TaskLicenseResultsBatchInSchema,
+    TaskLicenseResultsBatchOutSchema,
 )
+from core.services.notifier import ITaskNotifier
 from core.services.uow import IUnitOfWork
 
 
 class ITaskUseCase(Protocol):
-    def __init__(self, uow: IUnitOfWork) -> None: ...
+    def __init__(
+        self, uow: IUnitOfWork, notifier: ITaskNotifier | None = None
+    ) -> None: ...
 
     async def create_task(
         self,
         user: CreateLicenseTaskInSchema,
     ) -> LicenceTaskUseCaseOut: ...
 
+    async def create_tasks(
+        self,
+        users: Sequence[CreateLicenseTaskInSchema],
+    ) -> LicenceTasksBatchUseCaseOut: ...
+
     async def get_task_result(
-        self, task: TaskLicenseResultInSchema
+        self, task: TaskLicenseResultInSchema, *, wait: float | None = None
     ) -> TaskLicenseResultOutSchema | None: ...
 
+    async def get_task_results(
+        self, tasks: TaskLicenseResultsBatchInSchema
+    ) -> TaskLicenseResultsBatchOutSchema: ...
+
+    def stream_task_results(
+        self,
+        task_ids: Iterable[UUIDv4],
+        *,
+        after: datetime | None = None,
+        heartbeat: float,
+    ) -> AsyncIterator[LicenceTaskResultEvent | None]: ...
+
 
 class TaskUseCase:
-    def __init__(self, uow: IUnitOfWork) -> None:
+    def __init__(
+        self, uow: IUnitOfWork, notifier: ITaskNotifier | None = None
+    ) -> None:
         self._uow = uow
+        self._notifier = notifier
 
     async def create_task(
         self,
         user: CreateLicenseTaskInSchema,
+    ) -> LicenceTaskUseCaseOut:
+        try:
+            return await self._create_task(user)
+        except StaleCacheError:
+            # cached ids were cleared, the rows are upserted again
+            return await self._create_task(user)
+
+    async def create_tasks(
+        self,
+        users: Sequence[CreateLicenseTaskInSchema],
+    ) -> LicenceTasksBatchUseCaseOut:
+        try:
+            return await self._create_tasks(users)
+        except StaleCacheError:
+            return await self._create_tasks(users)
+
+    async def get_task_result(
+        self, task: TaskLicenseResultInSchema, *, wait: float | None = None
+    ) -> TaskLicenseResultOutSchema | None:
+        """
+        Return task result. If `wait` is passed and the task is pending,
+        wait up to `wait` seconds for the worker to save the result.
+        """
+        data = await self._read_task(task.task_id)
+        if data is None:
+            return None
+        if (
+            wait
+            and self._notifier is not None
+            and data.task_data.status == LicenseResultStatus.pending
+        ):
+            async with self._notifier.subscribe(data.task_data_id) as waiter:
+                data = await self._read_task(task.task_id)
+                if (
+                    data is not None
+                    and data.task_data.status == LicenseResultStatus.pending
+                ):
+                    try:
+                        await asyncio.wait_for(waiter, wait)
+                    except TimeoutError:
+                        pass
+                    else:
+                        data = await self._read_task(task.task_id)
+            if data is None:
+                return None
+        creds = data.task_data
+        return TaskLicenseResultOutSchema(
+            status=creds.status,
+            credentials=self._get_credentials(creds),
+        )
+
+    async def get_task_results(
+        self, tasks: TaskLicenseResultsBatchInSchema
+    ) -> TaskLicenseResultsBatchOutSchema:
+        task_ids = list(dict.fromkeys(tasks.task_ids))
+        data = await self._read_tasks(task_ids)
+        found = {task.id: task.task_data for task in data}
+        return TaskLicenseResultsBatchOutSchema(
+            results=[
+                TaskLicenseResultItemSchema(
+                    task_id=task_id,
+                    status=found[task_id].status,
+                    credentials=self._get_credentials(found[task_id]),
+                )
+                for task_id in task_ids
+                if task_id in found
+            ],
+            not_found=[
+                task_id for task_id in task_ids if task_id not in found
+            ],
+        )
+
+    async def stream_task_results(
+        self,
+        task_ids: Iterable[UUIDv4],
+        *,
+        after: datetime | None = None,
+        heartbeat: float,
+    ) -> AsyncIterator[LicenceTaskResultEvent | None]:
+        """
+        Yield results of `task_ids` as they are saved, finishing when no
+        task is pending. Results saved at or before `after` are skipped.
+        `None` is yielded after `heartbeat` seconds without results.
+        """
+        task_ids = list(dict.fromkeys(task_ids))
+        data = await self._read_tasks(task_ids)
+        task_data_ids = [task.task_data_id for task in data]
+        if self._notifier is None:
+            for task in data:
+                event = self._get_event(task, after)
+                if event is not None:
+                    yield event
+            return
+        async with self._notifier.subscribe_many(task_data_ids) as queue:
+            # re-read to not miss results saved before subscribing
+            data = await self._read_tasks(task_ids)
+            pending: dict[UUIDv4, UUIDv4] = {}
+            for task in sorted(data, key=lambda t: t.task_data.updated_at):
+                if task.task_data.status == LicenseResultStatus.pending:
+                    pending[task.task_data_id] = task.id
+                    continue
+                event = self._get_event(task, after)
+                if event is not None:
+                    yield event
+            while pending:
+                try:
+                    async with asyncio.timeout(heartbeat):
+                        task_data_id = await queue.get()
+                except TimeoutError:
+                    yield None
+                    continue
+                task_id = pending.get(task_data_id)
+                if task_id is None:
+                    continue
+                task = await self._read_task(task_id)
+                if (
+                    task is None
+                    or task.task_data.status == LicenseResultStatus.pending
+                ):
+                    continue
+                del pending[task_data_id]
+                event = self._get_event(task, after)
+                if event is not None:
+                    yield event
+
+    async def _create_task(
+        self, user: CreateLicenseTaskInSchema
     ) -> LicenceTaskUseCaseOut:
         async with self._uow as uow:
-            user_id = await uow.users.create_one(user.username)
-            script_id = await uow.scripts.create_one(user.script_name)
-            user_script_id = await uow.users_scripts.create_one(
-                user_id=user_id, script_id=script_id
-            )
-            task_data_id = await uow.license_tasks_data.create_one()
-            task_id = await uow.license_tasks.create_one(
-                task_data_id=task_data_id, user_script_id=user_script_id
+            task_id, task_data_id = (
+                await uow.license_tasks.create_for_user_script(
+                    username=user.username, script_name=user.script_name
+                )
             )
             await uow.commit()
         return LicenceTaskUseCaseOut(
@@ -50,27 +209,80 @@ class TaskUseCase:
             task_data_id=task_data_id,
         )
 
-    async def get_task_result(
-        self, task: TaskLicenseResultInSchema
-    ) -> TaskLicenseResultOutSchema | None:
+    async def _create_tasks(
+        self, users: Sequence[CreateLicenseTaskInSchema]
+    ) -> LicenceTasksBatchUseCaseOut:
         async with self._uow as uow:
-            data = await uow.license_tasks.read_one(task.task_id)
+            user_ids = await uow.users.create_many(
+                user.username for user in users
+            )
+            script_ids = await uow.scripts.create_many(
+                user.script_name for user in users
+            )
+            pairs = [
+                (user_ids[user.username], script_ids[user.script_name])
+                for user in users
+            ]
+            user_script_ids = await uow.users_scripts.create_many(pairs)
+            task_data_ids = await uow.license_tasks_data.create_many(
+                len(users)
+            )
+            task_ids = await uow.license_tasks.create_many(
+                (task_data_id, user_script_ids[pair])
+                for task_data_id, pair in zip(
+                    task_data_ids, pairs, strict=True
+                )
+            )
             await uow.commit()
-        if data is None:
+        return LicenceTasksBatchUseCaseOut(
+            response_data=CreateLicenseTasksBatchOutSchema(
+                tasks=[
+                    CreateLicenseTaskOutSchema(
+                        task_id=task_id, credentials=user
+                    )
+                    for task_id, user in zip(task_ids, users, strict=True)
+                ]
+            ),
+            task_data_ids=task_data_ids,
+        )
+
+    async def _read_tasks(
+        self, task_ids: Iterable[UUIDv4]
+    ) -> Sequence[LicenseTasksModel]:
+        async with self._uow as uow:
+            data = await uow.license_tasks.read_many(task_ids)
+            await uow.commit()
+        return data
+
+    async def _read_task(self, task_id: UUIDv4) -> LicenseTasksModel | None:
+        async with self._uow as uow:
+            data = await uow.license_tasks.read_one(task_id)
+            await uow.commit()
+        return data
+
+    @classmethod
+    def _get_event(
+        cls, task: LicenseTasksModel, after: datetime | None
+    ) -> LicenceTaskResultEvent | None:
+        creds = task.task_data
+        if after is not None and creds.updated_at <= after:
             return None
-        creds = data.task_data
-        if (
-            creds is None
-            or creds.is_expired is None
-            or creds.expires_in is None
-        ):
-            return TaskLicenseResultOutSchema(
+        return LicenceTaskResultEvent(
+            response_data=TaskLicenseResultItemSchema(
+                task_id=task.id,
                 status=creds.status,
-            )
-        return TaskLicenseResultOutSchema(
-            status=creds.status,
-            credentials=LicenseDetailsSchema(
-                is_expired=creds.is_expired,
-                expires_in=creds.expires_in
+                credentials=cls._get_credentials(creds),
             ),
+            cursor=creds.updated_at,
+        )
+
+    @staticmethod
+    def _get_credentials(
+        creds: LicenseTasksDataModel,
+    ) -> LicenseDetailsSchema | None:
+        if creds.is_expired is None or creds.expires_in is None:
+            return None
+        return LicenseDetailsSchema(
+            is_expired=creds.is_expired,
+            expires_in=creds.expires_in
         )
@@ -1,3 +1,4 @@
+from .cache import LRUCache
 from .decorators import exc_wrapper
 from .http_client import (
     CookieError,
@@ -23,6 +24,7 @@ __all__ = [
     "IClientSession",
     "IHTTPClient",
     "JSONHTTPResponse",
+    "LRUCache",
     "LoggerCallerTypes",
     "RetryAiohttpClient",
     "TextHTTPResponse",
@@ -0,0 +1,36 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+
+from core.services.metrics import CACHE_HITS, CACHE_MISSES
+
+
+class LRUCache[K: Hashable, V]:
+    """Bounded mapping evicting the least recently used keys"""
+
+    def __init__(self, name: str, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._hits = CACHE_HITS.labels(name)
+        self._misses = CACHE_MISSES.labels(name)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> V | None:
+        try:
+            value = self._data[key]
+        except KeyError:
+            self._misses.inc()
+            return None
+        self._data.move_to_end(key)
+        self._hits.inc()
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
@@ -7,27 +7,44 @@ from prometheus_fastapi_instrumentator import Instrumentator
 
 from core.config import settings
 from core.models import get_sqlalchemy_engine
+from core.repositories import IdCache
 from core.schemas import ErrorDetailsSchema, ErrorResponse
+from core.services.notifier import TaskNotifier
 from core.utils import get_client_session, get_loki_logger, get_null_logger
 from v1.handlers import http_exception_handler, request_validation_handler
 from v1.middlewares import EncryptionMiddleware
 from v1.routers import license
+from v1.utils import ConnectionLimiter, ResponseSigner, get_signer
 
 
 def create_app(enable_monitoring: bool = True) -> FastAPI:
     @asynccontextmanager
     async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
         app.state.engine = get_sqlalchemy_engine(settings.dsn)
+        app.state.id_cache = IdCache.create(settings.id_cache_size)
         app.state.http_session = get_client_session(timeout=30)
+        app.state.signer = ResponseSigner(
+            get_signer(settings.private_key, settings.signature_algorithm),
+            max_workers=settings.signature_workers,
+        )
+        app.state.stream_limiter = ConnectionLimiter(
+            settings.stream_max_connections
+        )
         if enable_monitoring:
             app.state.logger = get_loki_logger()
         else:
             app.state.logger = get_null_logger()
+        app.state.task_notifier = TaskNotifier(
+            app.state.engine, app.state.logger
+        )
+        await app.state.task_notifier.start()
 
         yield
 
+        await app.state.task_notifier.stop()
         await app.state.engine.dispose()
         await app.state.http_session.close()
+        app.state.signer.close()
 
     app = FastAPI(
         title="BAS License API",
@@ -1,4 +1,12 @@
 from .bas_worker import BasWorkerDependency
+from .logger import LoggerDependency
+from .streams import ResponseSignerDependency, StreamLimiterDependency
 from .use_cases import TaskUseCaseDependency
 
-__all__ = ["BasWorkerDependency", "TaskUseCaseDependency"]
+__all__ = [
+    "BasWorkerDependency",
+    "LoggerDependency",
+    "ResponseSignerDependency",
+    "StreamLimiterDependency",
+    "TaskUseCaseDependency",
+]
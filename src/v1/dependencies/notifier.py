@@ -0,0 +1,12 @@
+from typing import Annotated
+
+from fastapi import Depends, Request
+
+from core.services.notifier import ITaskNotifier
+
+
+def get_task_notifier(request: Request) -> ITaskNotifier:
+    return request.app.state.task_notifier
+
+
+TaskNotifierDependency = Annotated[ITaskNotifier, Depends(get_task_notifier)]
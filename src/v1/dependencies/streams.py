@@ -0,0 +1,21 @@
+from typing import Annotated
+
+from fastapi import Depends, Request
+
+from v1.utils import ConnectionLimiter, ResponseSigner
+
+
+def get_response_signer(request: Request) -> ResponseSigner:
+    return request.app.state.signer
+
+
+def get_stream_limiter(request: Request) -> ConnectionLimiter:
+    return request.app.state.stream_limiter
+
+
+ResponseSignerDependency = Annotated[
+    ResponseSigner, Depends(get_response_signer)
+]
+StreamLimiterDependency = Annotated[
+    ConnectionLimiter, Depends(get_stream_limiter)
+]
@@ -8,7 +8,7 @@ from core.services.uow import IUnitOfWork, UnitOfWork
 
 def get_uow(request: Request) -> IUnitOfWork:
     session_factory = get_sqlalchemy_session_factory(request.app.state.engine)
-    return UnitOfWork(session_factory)
+    return UnitOfWork(session_factory, request.app.state.id_cache)
 
 
 UOWDependency = Annotated[IUnitOfWork, Depends(get_uow)]
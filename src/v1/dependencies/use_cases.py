@@ -11,6 +11,7 @@ from core.use_cases import (
     TaskUseCase,
 )
 
+from .notifier import TaskNotifierDependency
 from .uow import UOWDependency
 
 
@@ -32,8 +33,10 @@ LicenseUseCaseDependency = Annotated[
 ]
 
 
-def task_use_case(uow: UOWDependency) -> ITaskUseCase:
-    return TaskUseCase(uow)
+def task_use_case(
+    uow: UOWDependency, notifier: TaskNotifierDependency
+) -> ITaskUseCase:
+    return TaskUseCase(uow, notifier)
 
 
 TaskUseCaseDependency = Annotated[ITaskUseCase, Depends(task_use_case)]
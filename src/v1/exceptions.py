@@ -14,3 +14,11 @@ class NotFoundError(HTTPException):
         )
         self.loc = loc
         self.field = field
+
+
+class TooManyConnectionsError(HTTPException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=constants.TOO_MANY_CONNECTIONS,
+        )
@@ -1,38 +1,86 @@
-import base64
-
-from starlette.concurrency import iterate_in_threadpool
-from starlette.middleware.base import (
-    BaseHTTPMiddleware,
-    RequestResponseEndpoint,
-)
-from starlette.requests import Request
-from starlette.responses import Response
+import hashlib
+
+from starlette.datastructures import MutableHeaders
 from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .utils import ResponseSigner
 
-from core.config import settings
 
-from .utils import EncryptionMixin
+class _SigningResponder:
+    """
+    Hold back `http.response.start` until the last body message arrives,
+    hashing body chunks as they pass, then send the start message with the
+    signature headers followed by the original chunks.
+    """
 
+    def __init__(self, send: Send, signer: ResponseSigner) -> None:
+        self._send = send
+        self._signer = signer
+        self._start_message: Message | None = None
+        self._chunks: list[bytes] = []
+        self._hash = hashlib.sha256()
 
-class EncryptionMiddleware(BaseHTTPMiddleware, EncryptionMixin):
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
-        response = await call_next(request)
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            if message["status"] < HTTP_500_INTERNAL_SERVER_ERROR:
+                self._start_message = message
+            else:
+                await self._send(message)
+            return
         if (
-            response.status_code < HTTP_500_INTERNAL_SERVER_ERROR
-            and request.method in ("POST", "PUT", "PATCH")
+            self._start_message is None
+            or message["type"] != "http.response.body"
         ):
-            body = [section async for section in response.body_iterator]  # type: ignore
-            response.body_iterator = iterate_in_threadpool(iter(body))  # type: ignore
+            await self._send(message)
+            return
+
+        body: bytes = message.get("body", b"")
+        if self._signer.prehashed:
+            self._hash.update(body)
+        self._chunks.append(body)
+        if message.get("more_body", False):
+            return
+
+        if self._signer.prehashed:
+            signature = await self._signer.sign(self._hash.digest())
+        else:
+            signature = await self._signer.sign(b"".join(self._chunks))
+        headers = MutableHeaders(scope=self._start_message)
+        headers[EncryptionMiddleware.SIGNATURE_HEADER] = signature
+        headers[EncryptionMiddleware.ALGORITHM_HEADER] = (
+            self._signer.algorithm.value
+        )
+        await self._send(self._start_message)
+        last = len(self._chunks) - 1
+        for i, chunk in enumerate(self._chunks):
+            await self._send(
+                {
+                    "type": "http.response.body",
+                    "body": chunk,
+                    "more_body": i < last,
+                }
+            )
+        self._chunks.clear()
+
 
-            priv_key = super().serialize_pem_private_key(settings.private_key)
-            digest = super().get_sha256_hash(body[0])
-            signature = super().get_signature(priv_key, digest)
-            response.headers["X-Signature"] = base64.b64encode(
-                signature
-            ).decode()
+class EncryptionMiddleware:
+    SIGNATURE_HEADER = "X-Signature"
+    ALGORITHM_HEADER = "X-Signature-Algorithm"
+    SIGNED_METHODS = ("POST", "PUT", "PATCH")
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in self.SIGNED_METHODS
+        ):
+            await self.app(scope, receive, send)
+            return
 
-        return response
+        signer: ResponseSigner = scope["app"].state.signer
+        await self.app(scope, receive, _SigningResponder(send, signer))
@@ -1,6 +1,6 @@
-from collections.abc import Mapping
+from collections.abc import AsyncIterable, Mapping
 
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from starlette.background import BackgroundTask
 
 from core.schemas import ErrorResponse
@@ -21,3 +21,23 @@ class GenericErrorResponse[T](JSONResponse):
         return super().render(
             ErrorResponse(data=content).model_dump(mode="json")
         )
+
+
+class EventSourceResponse(StreamingResponse):
+    media_type = "text/event-stream"
+
+    def __init__(
+        self,
+        content: AsyncIterable[str],
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        background: BackgroundTask | None = None,
+    ) -> None:
+        headers = {
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+            **(headers or {}),
+        }
+        super().__init__(
+            content, status_code, headers, self.media_type, background
+        )
@@ -1,17 +1,40 @@
-from fastapi import APIRouter, BackgroundTasks, status
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Annotated
 
+from fastapi import APIRouter, BackgroundTasks, Header, Query, status
+from starlette.background import BackgroundTask
+
+from core.config import settings
+from core._types import UUIDv4
 from core.enums import Location
 from core.schemas import (
     CreateLicenseTaskInSchema,
     CreateLicenseTaskOutSchema,
+    CreateLicenseTasksBatchInSchema,
+    CreateLicenseTasksBatchOutSchema,
+    ErrorDetailsSchema,
     ErrorResponse,
     SuccessResponse,
     TaskLicenseResultInSchema,
     TaskLicenseResultOutSchema,
+    TaskLicenseResultsBatchInSchema,
+    TaskLicenseResultsBatchOutSchema,
     TaskNotFoundSchema,
 )
-from v1.dependencies import BasWorkerDependency, TaskUseCaseDependency
-from v1.exceptions import NotFoundError
+from v1.dependencies import (
+    BasWorkerDependency,
+    LoggerDependency,
+    ResponseSignerDependency,
+    StreamLimiterDependency,
+    TaskUseCaseDependency,
+)
+from v1.exceptions import NotFoundError, TooManyConnectionsError
+from v1.middlewares import EncryptionMiddleware
+from v1.responses import EventSourceResponse
+from v1.utils import format_comment, format_event
 
 router = APIRouter(prefix="/v1/license", tags=["License"])
 
@@ -22,10 +45,58 @@ async def create_task(
     user: CreateLicenseTaskInSchema,
     bas_client: BasWorkerDependency,
     task_use_case: TaskUseCaseDependency,
+    logger: LoggerDependency,
+    wait_ms: Annotated[
+        int | None,
+        Query(
+            gt=0,
+            le=int(settings.result_max_wait * 1000),
+            description=(
+                "Milliseconds to wait for the task result, "
+                "it's returned in `result` if ready"
+            ),
+        ),
+    ] = None,
 ) -> SuccessResponse[CreateLicenseTaskOutSchema]:
     data = await task_use_case.create_task(user=user)
+    if wait_ms is None:
+        background_tasks.add_task(
+            bas_client, data.task_data_id, user.username, user.script_name
+        )
+        return SuccessResponse(data=data.response_data)
+
+    worker = asyncio.create_task(
+        bas_client(data.task_data_id, user.username, user.script_name)
+    )
+    done, _ = await asyncio.wait({worker}, timeout=wait_ms / 1000)
+    if not done:
+        # keep the worker running after the response like a background task
+        background_tasks.add_task(_await_worker, worker)
+    elif (exc := worker.exception()) is not None:
+        logger.error("BAS worker task failed", exc_info=exc)
+    else:
+        data.response_data.result = await task_use_case.get_task_result(
+            TaskLicenseResultInSchema(task_id=data.response_data.task_id)
+        )
+    return SuccessResponse(data=data.response_data)
+
+
+@router.post("/batch/", status_code=status.HTTP_201_CREATED)
+async def create_tasks_batch(
+    background_tasks: BackgroundTasks,
+    batch: CreateLicenseTasksBatchInSchema,
+    bas_client: BasWorkerDependency,
+    task_use_case: TaskUseCaseDependency,
+) -> SuccessResponse[CreateLicenseTasksBatchOutSchema]:
+    data = await task_use_case.create_tasks(batch.tasks)
     background_tasks.add_task(
-        bas_client, data.task_data_id, user.username, user.script_name
+        bas_client.process_many,
+        [
+            (task_data_id, user.username, user.script_name)
+            for task_data_id, user in zip(
+                data.task_data_ids, batch.tasks, strict=True
+            )
+        ],
     )
     return SuccessResponse(data=data.response_data)
 
@@ -42,8 +113,99 @@ async def create_task(
 async def get_task_result(
     task: TaskLicenseResultInSchema,
     task_use_case: TaskUseCaseDependency,
+    wait: Annotated[
+        float | None,
+        Query(
+            gt=0,
+            le=settings.result_max_wait,
+            description="Seconds to wait while the task is pending",
+        ),
+    ] = None,
 ) -> SuccessResponse[TaskLicenseResultOutSchema]:
-    data = await task_use_case.get_task_result(task=task)
+    data = await task_use_case.get_task_result(task=task, wait=wait)
     if data is None:
         raise NotFoundError("Task id", loc=Location.body, field="task_id")
     return SuccessResponse(data=data)
+
+
+@router.post("/result/batch/")
+async def get_task_results_batch(
+    tasks: TaskLicenseResultsBatchInSchema,
+    task_use_case: TaskUseCaseDependency,
+) -> SuccessResponse[TaskLicenseResultsBatchOutSchema]:
+    data = await task_use_case.get_task_results(tasks=tasks)
+    return SuccessResponse(data=data)
+
+
+@router.get(
+    "/stream/",
+    response_class=EventSourceResponse,
+    responses={
+        status.HTTP_200_OK: dict(
+            content={"text/event-stream": {}},
+            description=(
+                "`result` events with `{body, signature}` JSON data, where "
+                "`body` is a serialized task result"
+            ),
+        ),
+        status.HTTP_503_SERVICE_UNAVAILABLE: dict(
+            model=ErrorResponse[ErrorDetailsSchema],
+            description="Too many open streams",
+        ),
+    },
+)
+async def stream_task_results(
+    task_ids: Annotated[
+        list[UUIDv4],
+        Query(min_length=1, max_length=settings.batch_max_size),
+    ],
+    task_use_case: TaskUseCaseDependency,
+    signer: ResponseSignerDependency,
+    limiter: StreamLimiterDependency,
+    last_event_id: Annotated[str | None, Header()] = None,
+) -> EventSourceResponse:
+    lease = limiter.acquire()
+    if lease is None:
+        raise TooManyConnectionsError()
+    after = _parse_event_id(last_event_id)
+
+    async def stream() -> AsyncIterator[str]:
+        try:
+            async for event in task_use_case.stream_task_results(
+                task_ids,
+                after=after,
+                heartbeat=settings.stream_heartbeat_interval,
+            ):
+                if event is None:
+                    yield format_comment("heartbeat")
+                    continue
+                body = event.response_data.model_dump_json()
+                signature = await signer.sign_body(body.encode())
+                yield format_event(
+                    json.dumps(dict(body=body, signature=signature)),
+                    event="result",
+                    event_id=event.cursor.isoformat(),
+                )
+        finally:
+            lease.release()
+
+    return EventSourceResponse(
+        stream(),
+        headers={
+            EncryptionMiddleware.ALGORITHM_HEADER: signer.algorithm.value
+        },
+        background=BackgroundTask(lease.release),
+    )
+
+
+def _parse_event_id(event_id: str | None) -> datetime | None:
+    if event_id is None:
+        return None
+    try:
+        return datetime.fromisoformat(event_id).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+async def _await_worker(worker: asyncio.Task[None]) -> None:
+    await worker
@@ -1,3 +1,30 @@
-from .encryption import EncryptionMixin
+from .encryption import EncryptionMixin, ResponseSigner
+from .signers import (
+    BaseSigner,
+    ECDSAP256Signer,
+    Ed25519Signer,
+    RSAPKCS1v15Signer,
+    RSAPSSSigner,
+    get_signer,
+)
+from .sse import (
+    ConnectionLease,
+    ConnectionLimiter,
+    format_comment,
+    format_event,
+)
 
-__all__ = ["EncryptionMixin"]
+__all__ = [
+    "BaseSigner",
+    "ConnectionLease",
+    "ConnectionLimiter",
+    "ECDSAP256Signer",
+    "Ed25519Signer",
+    "EncryptionMixin",
+    "RSAPKCS1v15Signer",
+    "RSAPSSSigner",
+    "ResponseSigner",
+    "format_comment",
+    "format_event",
+    "get_signer",
+]
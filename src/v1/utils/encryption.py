@@ -1,5 +1,8 @@
+import asyncio
 import base64
 import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, cast
 
 from cryptography.hazmat.backends import default_backend
@@ -9,6 +12,15 @@ from cryptography.hazmat.primitives.asymmetric import padding
 from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
 from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
 
+from core.enums import SignatureAlgorithm
+from core.services.metrics import (
+    RESPONSE_SIGNATURE_LATENCY,
+    RESPONSE_SIGNATURE_WAIT,
+    RESPONSE_SIGNATURES_IN_PROGRESS,
+)
+
+from .signers import BaseSigner
+
 
 class EncryptionMixin:
     def serialize_pem_private_key(
@@ -39,3 +51,55 @@ class EncryptionMixin:
             padding_ or padding.PKCS1v15(),
             Prehashed(hashes.SHA256()),
         )
+
+
+class ResponseSigner:
+    """
+    Sign response bodies with a signer whose key is parsed once on
+    creation. Signatures are computed in a bounded thread pool, so the
+    event loop keeps serving other requests meanwhile.
+    """
+
+    def __init__(self, signer: BaseSigner, *, max_workers: int) -> None:
+        self._signer = signer
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="signer"
+        )
+
+    @property
+    def algorithm(self) -> SignatureAlgorithm:
+        return self._signer.algorithm
+
+    @property
+    def prehashed(self) -> bool:
+        return self._signer.prehashed
+
+    def _sign(self, data: bytes) -> bytes:
+        start_time = time.perf_counter()
+        signature = self._signer.sign(data)
+        RESPONSE_SIGNATURE_LATENCY.labels(
+            algorithm=self.algorithm.value
+        ).observe(time.perf_counter() - start_time)
+        return signature
+
+    async def sign(self, data: bytes) -> str:
+        """
+        Sign `data`: a SHA-256 digest of the body if the signer is
+        `prehashed`, the body itself otherwise.
+        """
+        loop = asyncio.get_running_loop()
+        start_time = time.perf_counter()
+        with RESPONSE_SIGNATURES_IN_PROGRESS.track_inprogress():
+            signature = await loop.run_in_executor(
+                self._executor, self._sign, data
+            )
+        RESPONSE_SIGNATURE_WAIT.observe(time.perf_counter() - start_time)
+        return base64.b64encode(signature).decode()
+
+    async def sign_body(self, body: bytes) -> str:
+        if self.prehashed:
+            return await self.sign(hashlib.sha256(body).digest())
+        return await self.sign(body)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,104 @@
+import base64
+from abc import ABC, abstractmethod
+from typing import Any, ClassVar
+
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import (
+    ec,
+    ed25519,
+    padding,
+    rsa,
+)
+from cryptography.hazmat.primitives.asymmetric.types import (
+    PrivateKeyTypes,
+)
+from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
+
+from core.enums import SignatureAlgorithm
+
+
+class BaseSigner(ABC):
+    registry: dict[SignatureAlgorithm, type["BaseSigner"]] = {}
+    algorithm: ClassVar[SignatureAlgorithm]
+    key_type: ClassVar[type]
+    # `sign` receives a SHA-256 digest instead of the whole message
+    prehashed: ClassVar[bool] = True
+
+    def __init_subclass__(cls, algorithm: SignatureAlgorithm, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        cls.algorithm = algorithm
+        cls.registry[algorithm] = cls
+
+    def __init__(self, private_key: PrivateKeyTypes) -> None:
+        if not isinstance(private_key, self.key_type):
+            raise ValueError(
+                f"{self.algorithm.value} requires {self.key_type.__name__}, "
+                f"got {type(private_key).__name__}"
+            )
+        self._private_key = private_key
+
+    @abstractmethod
+    def sign(self, data: bytes) -> bytes:
+        raise NotImplementedError()
+
+
+class RSAPKCS1v15Signer(
+    BaseSigner, algorithm=SignatureAlgorithm.rsa_pkcs1v15
+):
+    key_type = rsa.RSAPrivateKey
+
+    def sign(self, data: bytes) -> bytes:
+        return self._private_key.sign(
+            data, padding.PKCS1v15(), Prehashed(hashes.SHA256())
+        )
+
+
+class RSAPSSSigner(BaseSigner, algorithm=SignatureAlgorithm.rsa_pss):
+    key_type = rsa.RSAPrivateKey
+
+    def sign(self, data: bytes) -> bytes:
+        return self._private_key.sign(
+            data,
+            padding.PSS(
+                mgf=padding.MGF1(hashes.SHA256()),
+                salt_length=padding.PSS.DIGEST_LENGTH,
+            ),
+            Prehashed(hashes.SHA256()),
+        )
+
+
+class ECDSAP256Signer(BaseSigner, algorithm=SignatureAlgorithm.ecdsa_p256):
+    key_type = ec.EllipticCurvePrivateKey
+
+    def __init__(self, private_key: PrivateKeyTypes) -> None:
+        super().__init__(private_key)
+        if not isinstance(self._private_key.curve, ec.SECP256R1):
+            raise ValueError(
+                f"{self.algorithm.value} requires a P-256 key, "
+                f"got {self._private_key.curve.name}"
+            )
+
+    def sign(self, data: bytes) -> bytes:
+        return self._private_key.sign(
+            data, ec.ECDSA(Prehashed(hashes.SHA256()))
+        )
+
+
+class Ed25519Signer(BaseSigner, algorithm=SignatureAlgorithm.ed25519):
+    key_type = ed25519.Ed25519PrivateKey
+    prehashed = False
+
+    def sign(self, data: bytes) -> bytes:
+        return self._private_key.sign(data)
+
+
+def get_signer(
+    base64_encoded_pem_key: str, algorithm: SignatureAlgorithm
+) -> BaseSigner:
+    signer_class = BaseSigner.registry.get(algorithm)
+    if signer_class is None:
+        raise ValueError(f"Unknown signature algorithm: {algorithm}")
+    private_key = serialization.load_pem_private_key(
+        base64.b64decode(base64_encoded_pem_key), password=None
+    )
+    return signer_class(private_key)
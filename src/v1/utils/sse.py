@@ -0,0 +1,47 @@
+class ConnectionLimiter:
+    """Non-blocking counter of open connections"""
+
+    def __init__(self, limit: int) -> None:
+        self._limit = limit
+        self._count = 0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def acquire(self) -> "ConnectionLease | None":
+        if self._count >= self._limit:
+            return None
+        self._count += 1
+        return ConnectionLease(self)
+
+    def _release(self) -> None:
+        self._count -= 1
+
+
+class ConnectionLease:
+    def __init__(self, limiter: ConnectionLimiter) -> None:
+        self._limiter = limiter
+        self._released = False
+
+    def release(self) -> None:
+        """Release the connection, may be called more than once"""
+        if not self._released:
+            self._released = True
+            self._limiter._release()
+
+
+def format_event(
+    data: str, *, event: str | None = None, event_id: str | None = None
+) -> str:
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if event is not None:
+        lines.append(f"event: {event}")
+    lines.extend(f"data: {line}" for line in data.splitlines())
+    return "\n".join(lines) + "\n\n"
+
+
+def format_comment(comment: str) -> str:
+    return f": {comment}\n\n"
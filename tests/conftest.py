@@ -17,6 +17,8 @@ from sqlalchemy.ext.asyncio import (
 
 from core.config import Settings
 from core.models import get_sqlalchemy_engine
+from core.repositories import IdCache
+from core.services.notifier import TaskNotifier
 from core.services.bas import BasAPIClient, BasAuthClient
 from core.services.recaptcha import (
     BaseRecaptchaClient,
@@ -27,6 +29,7 @@ from core.services.uow import IUnitOfWork, UnitOfWork
 from core.utils import RetryAiohttpClient, get_null_logger
 from core.utils.http_client.client import SingleRetryClient
 from v1.dependencies.http_client import get_http_client
+from v1.utils import ConnectionLimiter, ResponseSigner, get_signer
 
 from .helpers import (
     App,
@@ -149,7 +152,9 @@ async def aiohttp_client() -> (
 
 
 @pytest.fixture(scope="module")
-async def app(dsn: str, logger: Logger) -> AsyncGenerator[FastAPI, None]:
+async def app(
+    settings: Settings, dsn: str, logger: Logger
+) -> AsyncGenerator[FastAPI, None]:
     from main import create_app
 
     @asynccontextmanager
@@ -159,13 +164,25 @@ async def app(dsn: str, logger: Logger) -> AsyncGenerator[FastAPI, None]:
     app = create_app(enable_monitoring=False)
     app.router.lifespan_context = lifespan
     app.state.engine = get_sqlalchemy_engine(dsn, debug=False)
+    app.state.id_cache = IdCache.create(settings.id_cache_size)
     app.state.logger = logger
+    app.state.signer = ResponseSigner(
+        get_signer(settings.private_key, settings.signature_algorithm),
+        max_workers=settings.signature_workers,
+    )
+    app.state.stream_limiter = ConnectionLimiter(
+        settings.stream_max_connections
+    )
     await create_sqlalchemy_tables(app.state.engine)
+    app.state.task_notifier = TaskNotifier(app.state.engine, logger)
+    await app.state.task_notifier.start()
 
     yield app
 
+    await app.state.task_notifier.stop()
     await drop_sqlalchemy_tables(app.state.engine)
     await app.state.engine.dispose()
+    app.state.signer.close()
     app.dependency_overrides.clear()
 
 
@@ -3,6 +3,7 @@ from .api import (
     get_response_data,
     get_success_response_data,
     license_create_task,
+    license_stream_events,
 )
 from .database import create_sqlalchemy_tables, drop_sqlalchemy_tables
 from .routers import App
@@ -15,4 +16,5 @@ __all__ = [
     "get_response_data",
     "get_success_response_data",
     "license_create_task",
+    "license_stream_events",
 ]
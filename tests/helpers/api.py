@@ -52,3 +52,35 @@ async def license_create_task(
         task_id, str
     ), f"Field 'data.task_id' must be UUID, not {type(task_id)}"
     return task_id
+
+
+async def license_stream_events(
+    *,
+    client: AsyncClient,
+    task_ids: list[str],
+    last_event_id: str | None = None,
+) -> list[dict[str, Any]]:
+    headers = {}
+    if last_event_id is not None:
+        headers["Last-Event-ID"] = last_event_id
+    events = []
+    event: dict[str, Any] = {}
+    async with client.stream(
+        "GET",
+        "/v1/license/stream/",
+        params=dict(task_ids=task_ids),
+        headers=headers,
+    ) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith(
+            "text/event-stream"
+        )
+        async for line in response.aiter_lines():
+            if not line:
+                if event:
+                    events.append(event)
+                event = {}
+            elif not line.startswith(":"):
+                field, _, value = line.partition(": ")
+                event[field] = value
+    return events
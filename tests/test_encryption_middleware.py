@@ -0,0 +1,140 @@
+import base64
+from collections.abc import AsyncGenerator, AsyncIterator
+
+import pytest
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec, padding
+from cryptography.hazmat.primitives.asymmetric.types import (
+    PrivateKeyTypes,
+    PublicKeyTypes,
+)
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+
+from core.enums import SignatureAlgorithm
+from scripts.generate_keys import encode_private_key, generate_private_key
+from v1.middlewares import EncryptionMiddleware
+from v1.utils import ResponseSigner, get_signer
+
+CHUNKS = [b'{"data": ', b'"chunked', b' body"}']
+
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+def verify(
+    algorithm: SignatureAlgorithm,
+    public_key: PublicKeyTypes,
+    signature: bytes,
+    body: bytes,
+) -> None:
+    match algorithm:
+        case SignatureAlgorithm.rsa_pkcs1v15:
+            public_key.verify(
+                signature, body, padding.PKCS1v15(), hashes.SHA256()
+            )
+        case SignatureAlgorithm.rsa_pss:
+            public_key.verify(
+                signature,
+                body,
+                padding.PSS(
+                    mgf=padding.MGF1(hashes.SHA256()),
+                    salt_length=padding.PSS.DIGEST_LENGTH,
+                ),
+                hashes.SHA256(),
+            )
+        case SignatureAlgorithm.ecdsa_p256:
+            public_key.verify(signature, body, ec.ECDSA(hashes.SHA256()))
+        case SignatureAlgorithm.ed25519:
+            public_key.verify(signature, body)
+
+
+async def chunked_handler(_: Request) -> Response:
+    async def iterator() -> AsyncIterator[bytes]:
+        for chunk in CHUNKS:
+            yield chunk
+
+    return StreamingResponse(iterator())
+
+
+async def server_error_handler(_: Request) -> Response:
+    return Response(b"error", status_code=500)
+
+
+@pytest.fixture(scope="module", params=list(SignatureAlgorithm))
+def algorithm(request: pytest.FixtureRequest) -> SignatureAlgorithm:
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def private_key(algorithm: SignatureAlgorithm) -> PrivateKeyTypes:
+    return generate_private_key(algorithm.value)
+
+
+@pytest.fixture(scope="module")
+async def client(
+    algorithm: SignatureAlgorithm, private_key: PrivateKeyTypes
+) -> AsyncGenerator[AsyncClient, None]:
+    app = Starlette(
+        routes=[
+            Route("/chunked", chunked_handler, methods=["GET", "POST"]),
+            Route("/error", server_error_handler, methods=["POST"]),
+        ],
+        middleware=[Middleware(EncryptionMiddleware)],
+    )
+    app.state.signer = ResponseSigner(
+        get_signer(encode_private_key(private_key), algorithm),
+        max_workers=1,
+    )
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test_api"
+    ) as aclient:
+        yield aclient
+    app.state.signer.close()
+
+
+async def test_signature_covers_all_chunks(
+    client: AsyncClient,
+    algorithm: SignatureAlgorithm,
+    private_key: PrivateKeyTypes,
+):
+    response = await client.post("/chunked")
+    assert response.content == b"".join(CHUNKS)
+    assert response.headers.get("x-signature-algorithm") == algorithm.value
+    signature = response.headers.get("x-signature")
+    assert signature, "Header 'X-Signature' is missing"
+    verify(
+        algorithm,
+        private_key.public_key(),
+        base64.b64decode(signature),
+        response.content,
+    )
+    with pytest.raises(InvalidSignature):
+        verify(
+            algorithm,
+            private_key.public_key(),
+            base64.b64decode(signature),
+            CHUNKS[0],
+        )
+
+
+async def test_get_is_not_signed(client: AsyncClient):
+    response = await client.get("/chunked")
+    assert response.status_code == 200
+    assert response.headers.get("x-signature") is None
+
+
+async def test_server_error_is_not_signed(client: AsyncClient):
+    response = await client.post("/error")
+    assert response.status_code == 500
+    assert response.headers.get("x-signature") is None
+
+
+async def test_key_does_not_match_algorithm():
+    private_key = encode_private_key(generate_private_key("Ed25519"))
+    with pytest.raises(ValueError):
+        get_signer(private_key, SignatureAlgorithm.rsa_pkcs1v15)
@@ -4,7 +4,11 @@ from datetime import datetime
 
 import pytest
 from httpx import AsyncClient
+from pytest_mock import MockerFixture
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.models import UsersScriptsModel
 from core.services.uow import IUnitOfWork
 
 from .conftest import AppClient
@@ -207,3 +211,78 @@ async def test_task_id_not_found(client: AsyncClient):
     assert data.get("location") == "body"
     assert data.get("field") == "task_id"
     assert data.get("description") == "Task id not found"
+
+
+async def test_license_create_task_wait(client: AsyncClient):
+    data = dict(username=USER_ACTIVE, script_name=SCRIPT_NAME)
+    response = await client.post(
+        "/v1/license/", params=dict(wait_ms=5000), json=data
+    )
+    assert response.status_code == 201
+    data = get_success_response_data(response)
+    result = data.get("result")
+    assert isinstance(result, dict), "Result is not returned inline"
+    assert result.get("status") == "ok"
+    assert result["credentials"].get("is_expired") is False
+
+
+@pytest.mark.dependency(
+    depends=[f"test_task_id_in_db[{USER_ACTIVE}]"],
+    scope="module",
+)
+async def test_license_create_task_same_user_script(
+    client: AsyncClient, uow: IUnitOfWork, context: dict
+):
+    task_id = await license_create_task(
+        client=client, username=USER_ACTIVE, script_name=SCRIPT_NAME
+    )
+    async with uow:
+        task = await uow.license_tasks.read_one(uuid.UUID(task_id))
+        await uow.commit()
+    first_task = context[f"{USER_ACTIVE}_task_model"]
+    assert task.user_script_id == first_task.user_script_id
+    assert task.task_data_id != first_task.task_data_id
+
+
+async def test_license_create_task_deleted_user_script(
+    app_client: AppClient, uow: IUnitOfWork
+):
+    username = "deleted"
+    task_id = await license_create_task(
+        client=app_client.client, username=username, script_name=SCRIPT_NAME
+    )
+    async with uow:
+        task = await uow.license_tasks.read_one(uuid.UUID(task_id))
+        await uow.commit()
+    async with app_client.engine.begin() as conn:
+        await conn.execute(
+            delete(UsersScriptsModel).where(
+                UsersScriptsModel.id == task.user_script_id
+            )
+        )
+
+    task_id = await license_create_task(
+        client=app_client.client, username=username, script_name=SCRIPT_NAME
+    )
+    async with uow:
+        task = await uow.license_tasks.read_one(uuid.UUID(task_id))
+        await uow.commit()
+    assert task is not None, "Task with a deleted cached user script"
+
+
+async def test_license_create_task_cached_ids(
+    client: AsyncClient, mocker: MockerFixture
+):
+    username = "cached"
+    await license_create_task(
+        client=client, username=username, script_name=SCRIPT_NAME
+    )
+    execute = mocker.spy(AsyncSession, "execute")
+    await license_create_task(
+        client=client, username=username, script_name=SCRIPT_NAME
+    )
+    statements = [str(call.args[1]) for call in execute.call_args_list]
+    assert statements
+    assert not any("INSERT INTO users " in s for s in statements), (
+        "User is upserted again with cached ids"
+    )
@@ -0,0 +1,153 @@
+import json
+import uuid
+from collections.abc import AsyncGenerator, Callable
+
+import pytest
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .conftest import AppClient
+from .helpers import (
+    App,
+    get_error_response_data,
+    get_success_response_data,
+    license_stream_events,
+)
+
+USER_ACTIVE = "active"
+USER_EXPIRED = "expired"
+SCRIPT_NAME = "test_script"
+credentials = [
+    dict(username=USER_ACTIVE, script_name=SCRIPT_NAME),
+    dict(username=USER_EXPIRED, script_name=SCRIPT_NAME),
+    dict(username=USER_ACTIVE, script_name=SCRIPT_NAME),
+]
+
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="module"),
+    pytest.mark.use_set_session,
+]
+
+
+@pytest.fixture(scope="module")
+async def app_client(
+    app_client_factory: Callable[[App], AsyncGenerator[AppClient, None]],
+) -> AsyncGenerator[AppClient, None]:
+    web_app = App()
+    web_app.app.router.add_post(
+        "/bas/users/page",
+        web_app.user_license_succeed_handler,
+    )
+    async with app_client_factory(web_app.app) as client:
+        yield client
+
+
+@pytest.mark.dependency(scope="module")
+async def test_license_create_tasks_batch(client: AsyncClient, context: dict):
+    response = await client.post(
+        "/v1/license/batch/", json=dict(tasks=credentials)
+    )
+    assert response.status_code == 201
+    data = get_success_response_data(response)
+    tasks = data.get("tasks")
+    assert isinstance(tasks, list) and len(tasks) == len(credentials)
+    assert [task.get("credentials") for task in tasks] == credentials
+    task_ids = [task.get("task_id") for task in tasks]
+    assert len(set(task_ids)) == len(credentials), "Task ids are not unique"
+    context["task_ids"] = task_ids
+
+
+@pytest.mark.dependency(
+    depends=["test_license_create_tasks_batch"], scope="module"
+)
+@pytest.mark.parametrize(
+    ("index", "expected_expired"), [(0, False), (1, True), (2, False)]
+)
+async def test_license_batch_get_result(
+    client: AsyncClient, context: dict, index: int, expected_expired: bool
+):
+    task_id = context["task_ids"][index]
+    response = await client.post(
+        "/v1/license/result/", json=dict(task_id=task_id)
+    )
+    assert response.status_code == 200
+    data = get_success_response_data(response)
+    assert data.get("status") == "ok"
+    assert data["credentials"].get("is_expired") is expected_expired
+
+
+@pytest.mark.dependency(
+    depends=["test_license_create_tasks_batch"], scope="module"
+)
+async def test_license_batch_get_results(client: AsyncClient, context: dict):
+    unknown_task_id = str(uuid.uuid4())
+    task_ids = [*context["task_ids"], unknown_task_id]
+    response = await client.post(
+        "/v1/license/result/batch/", json=dict(task_ids=task_ids)
+    )
+    assert response.status_code == 200
+    data = get_success_response_data(response)
+    results = data.get("results")
+    assert [result.get("task_id") for result in results] == context[
+        "task_ids"
+    ]
+    assert all(result.get("status") == "ok" for result in results)
+    assert [
+        result["credentials"].get("is_expired") for result in results
+    ] == [False, True, False]
+    assert data.get("not_found") == [unknown_task_id]
+
+
+@pytest.mark.dependency(
+    depends=["test_license_create_tasks_batch"], scope="module"
+)
+async def test_license_batch_stream_results(
+    client: AsyncClient, context: dict
+):
+    events = await license_stream_events(
+        client=client, task_ids=context["task_ids"]
+    )
+    assert len(events) == len(credentials)
+    assert all(event.get("event") == "result" for event in events)
+    bodies = [json.loads(json.loads(e["data"])["body"]) for e in events]
+    assert sorted(body.get("task_id") for body in bodies) == sorted(
+        context["task_ids"]
+    )
+    assert all(body.get("status") == "ok" for body in bodies)
+    assert all(json.loads(e["data"]).get("signature") for e in events)
+
+    last_event_id = max(event["id"] for event in events)
+    events = await license_stream_events(
+        client=client,
+        task_ids=context["task_ids"],
+        last_event_id=last_event_id,
+    )
+    assert events == [], "Events before 'Last-Event-ID' are sent again"
+
+
+@pytest.mark.dependency(
+    depends=["test_license_create_tasks_batch"], scope="module"
+)
+async def test_license_create_tasks_batch_cached_ids(
+    client: AsyncClient, mocker: MockerFixture
+):
+    execute = mocker.spy(AsyncSession, "execute")
+    response = await client.post(
+        "/v1/license/batch/", json=dict(tasks=credentials)
+    )
+    assert response.status_code == 201
+    statements = [str(call.args[1]) for call in execute.call_args_list]
+    assert statements
+    upserts = ("INSERT INTO users ", "INSERT INTO scripts ")
+    assert not any(s.startswith(upserts) for s in statements), (
+        "Users and scripts are upserted again with cached ids"
+    )
+
+
+async def test_license_batch_empty(client: AsyncClient):
+    response = await client.post("/v1/license/batch/", json=dict(tasks=[]))
+    assert response.status_code == 422
+    data = get_error_response_data(response)
+    assert data.get("location") == "body"
+    assert data.get("field") == "tasks"
@@ -1,13 +1,23 @@
+import asyncio
+import json
+import time
+import uuid
 from collections.abc import AsyncGenerator, Callable
+from datetime import UTC, datetime
 
 import pytest
 from httpx import AsyncClient
 
+from core.enums import LicenseResultStatus
+from core.services.uow import IUnitOfWork
+from core.use_cases import LicenseUseCase
+
 from .conftest import AppClient
 from .helpers import (
     App,
     get_success_response_data,
     license_create_task,
+    license_stream_events,
 )
 
 USER_ACTIVE = "active"
@@ -62,3 +72,65 @@ async def test_license_pending_get_result(
     assert data.get("status") == "pending"
     assert data.get("is_expired") is None
     assert data.get("expires_in") is None
+
+
+async def test_license_pending_wait_result(
+    client: AsyncClient,
+    uow: IUnitOfWork,
+):
+    task_id = await license_create_task(
+        client=client, username="43", script_name="42"
+    )
+    async with uow:
+        task = await uow.license_tasks.read_one(uuid.UUID(task_id))
+        await uow.commit()
+
+    async def set_result() -> None:
+        await asyncio.sleep(0.5)
+        await LicenseUseCase(uow).set_license_data(
+            task.task_data_id,
+            status=LicenseResultStatus.ok,
+            expires_in=datetime.now(UTC),
+            is_expired=False,
+        )
+
+    setter = asyncio.create_task(set_result())
+    started = time.monotonic()
+    response = await client.post(
+        "/v1/license/result/",
+        params=dict(wait=10),
+        json=dict(task_id=task_id),
+    )
+    elapsed = time.monotonic() - started
+    await setter
+    assert response.status_code == 200
+    data = get_success_response_data(response)
+    assert data.get("status") == "ok"
+    assert data["credentials"].get("is_expired") is False
+    assert elapsed < 5, "Waiter was not woken up by the notification"
+
+
+async def test_license_pending_stream_result(
+    client: AsyncClient,
+    uow: IUnitOfWork,
+):
+    task_id = await license_create_task(
+        client=client, username="44", script_name="42"
+    )
+    async with uow:
+        task = await uow.license_tasks.read_one(uuid.UUID(task_id))
+        await uow.commit()
+
+    async def set_result() -> None:
+        await asyncio.sleep(0.5)
+        await LicenseUseCase(uow).set_license_data(
+            task.task_data_id, status=LicenseResultStatus.not_authorized
+        )
+
+    setter = asyncio.create_task(set_result())
+    events = await license_stream_events(client=client, task_ids=[task_id])
+    await setter
+    assert len(events) == 1
+    body = json.loads(json.loads(events[0]["data"])["body"])
+    assert body.get("task_id") == task_id
+    assert body.get("status") == "not_authorized"